@@ -0,0 +1,81 @@
+"""
+anmx
+----
+Applied Numerical Methods (root finding, linear systems, curve fitting,
+optimization, quadrature and ODE solvers) as one installable package.
+
+Every solver is reachable from the top level, e.g. ``anmx.rk4_method`` or
+``anmx.newton_raphson``, but nothing beyond the ``anmx`` package itself is
+imported until a name is first accessed (PEP 562 module ``__getattr__``).
+SciPy and matplotlib are never imported by the solvers; only the plotting
+and reference helpers that need them import them, inside the function.
+"""
+
+from importlib import import_module
+
+__version__ = "0.1.0"
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    # root finding
+    'bisection': 'root_finding.bisection_method',
+    'newton_raphson': 'root_finding.newton_raphson',
+    'newton_system': 'root_finding.newton_systems',
+    'fd_jacobian': 'root_finding.newton_systems',
+    # linear systems
+    'gauss_elimination': 'linear_systems.gauss_elimination',
+    'gauss_seidel': 'linear_systems.gauss_seidel',
+    'lu_decomposition': 'linear_systems.lu_decomposition',
+    'lu_solve': 'linear_systems.lu_decomposition',
+    # curve fitting and interpolation
+    'lagrange_interpolate': 'curve_fitting_interpolation.lagrange_interpolation',
+    'least_squares_linear': 'curve_fitting_interpolation.linear_regression',
+    'generate_cubic_spline': 'curve_fitting_interpolation.splines',
+    # optimization
+    'golden_section_search': 'optimization.golden_section_search',
+    'parabolic_interpolation': 'optimization.parabolic_interpolation',
+    # numerical integration
+    'trapezoid_rule': 'numerical_integration.newton_cotes',
+    'simpson_rule': 'numerical_integration.newton_cotes',
+    'romberg': 'numerical_integration.romberg',
+    'gauss_legendre': 'numerical_integration.gauss_quadrature',
+    'gauss_kronrod': 'numerical_integration.gauss_quadrature',
+    'adaptive_quad': 'numerical_integration.adaptive_quadrature',
+    # ordinary differential equations
+    'euler_method': 'ordinary_differential_equations.euler_method',
+    'rk4_method': 'ordinary_differential_equations.runge_kutta_4',
+    'dopri45_method': 'ordinary_differential_equations.dormand_prince',
+    'backward_euler_method': 'ordinary_differential_equations.implicit_methods',
+    'trapezoidal_method': 'ordinary_differential_equations.implicit_methods',
+    'bdf_method': 'ordinary_differential_equations.implicit_methods',
+    'euler_method_inplace': 'ordinary_differential_equations.inplace_stepping',
+    'rk4_method_inplace': 'ordinary_differential_equations.inplace_stepping',
+    'ensemble_solve': 'ordinary_differential_equations.ensemble',
+    'event': 'ordinary_differential_equations.events',
+    'fixed_step_with_events': 'ordinary_differential_equations.events',
+    'ode_stream': 'ordinary_differential_equations.streaming',
+    'save_stream': 'ordinary_differential_equations.streaming',
+    'shooting_method': 'ordinary_differential_equations.shooting_method',
+    'multiple_shooting': 'ordinary_differential_equations.shooting_method',
+    # instrumentation
+    'ConvergenceWarning': 'common.instrumentation',
+    'Tracer': 'common.instrumentation',
+    # result cache
+    'memoize': 'common.cache',
+    'ResultCache': 'common.cache',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Imports the defining submodule on first access and caches the attribute."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'anmx' has no attribute {name!r}")
+    value = getattr(import_module(f"anmx.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
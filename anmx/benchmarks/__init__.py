@@ -0,0 +1 @@
+"""Benchmark suite, convergence analysis and import-time checks."""
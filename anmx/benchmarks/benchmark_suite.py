@@ -0,0 +1,409 @@
+"""
+benchmark_suite.py
+--------------------------------
+Performance Benchmarks for Every Solver in the Repository.
+
+Summary:
+Each benchmark case sets up one solver on a problem of a given size (the
+matrix order n, the number of query points, the number of time steps, or
+the number of independent problems solved) and is swept over a list of
+sizes. For every size three quantities are recorded:
+    time        : best wall time of several repeats (s)
+    nfev        : calls of the problem function (None for matrix solvers)
+    peak_memory : peak memory allocated during one run (bytes, tracemalloc)
+The slope of log(time) against log(size) gives the empirical scaling
+exponent of each solver (1 = linear, 2 = quadratic, ...).
+
+Results are written to JSON. When a baseline file from an earlier run is
+given, every size is compared with it and reported as a regression if the
+time or peak memory grew by more than the threshold, or if nfev grew at
+all (evaluation counts are deterministic).
+
+Usage:
+    python -m anmx.benchmarks.benchmark_suite --save-baseline baseline.json
+    python -m anmx.benchmarks.benchmark_suite --baseline baseline.json --threshold 0.25
+The exit status is 1 if any regression was found, so the suite can gate CI.
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import numpy as np
+
+from anmx.root_finding.bisection_method import bisection
+from anmx.root_finding.newton_raphson import newton_raphson
+from anmx.root_finding.newton_systems import newton_system
+from anmx.linear_systems.gauss_elimination import gauss_elimination
+from anmx.linear_systems.lu_decomposition import lu_decomposition, lu_solve
+from anmx.linear_systems.gauss_seidel import gauss_seidel
+from anmx.curve_fitting_interpolation.lagrange_interpolation import lagrange_interpolate
+from anmx.curve_fitting_interpolation.splines import generate_cubic_spline
+from anmx.curve_fitting_interpolation.linear_regression import least_squares_linear
+from anmx.optimization.golden_section_search import golden_section_search
+from anmx.optimization.parabolic_interpolation import parabolic_interpolation
+from anmx.ordinary_differential_equations.euler_method import euler_method
+from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+from anmx.ordinary_differential_equations.dormand_prince import dopri45_method
+from anmx.ordinary_differential_equations.implicit_methods import bdf_method
+from anmx.numerical_integration.romberg import romberg
+from anmx.numerical_integration.adaptive_quadrature import adaptive_quad
+
+# name -> (setup function, list of sizes); filled by the @benchmark decorator
+BENCHMARKS = {}
+
+
+def benchmark(name, sizes):
+    """
+    Registers a benchmark case.
+
+    The decorated function setup(size) builds the problem and returns
+    (run, counter): run() performs the solve, and counter is a
+    CountingFunction wrapped around the problem function, or None.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, list(sizes))
+        return setup
+    return register
+
+
+class CountingFunction:
+    """Wraps a function and counts how often it is called."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.func(*args, **kwargs)
+
+
+def _diagonally_dominant(n, seed=0):
+    """Random n x n system with a strictly diagonally dominant matrix."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    return A, rng.uniform(-1, 1, n)
+
+
+def _oscillator(t, y):
+    """Lightly damped linear oscillator, the ODE test problem."""
+    return np.array([y[1], -0.1 * y[1] - 4.0 * y[0]])
+
+
+# --- Root finding: size = number of independent equations x^3 - x - c = 0 ---
+@benchmark('bisection', sizes=[10, 100, 1000])
+def _bisection_case(size):
+    constants = np.linspace(1, 5, size)
+    func = CountingFunction(lambda x, c: x**3 - x - c)
+    return lambda: [bisection(lambda x: func(x, c), 0, 3) for c in constants], func
+
+
+@benchmark('newton_raphson', sizes=[10, 100, 1000])
+def _newton_raphson_case(size):
+    constants = np.linspace(1, 5, size)
+    func = CountingFunction(lambda x, c: x**3 - x - c)
+    return lambda: [newton_raphson(lambda x: func(x, c), lambda x: 3*x**2 - 1, 1.5)
+                    for c in constants], func
+
+
+# --- Nonlinear systems: size = number of unknowns (discretized Bratu problem) ---
+@benchmark('newton_system', sizes=[20, 40, 80])
+def _newton_system_case(size):
+    dx = 1.0 / (size + 1)
+
+    def bratu(u):
+        u_pad = np.concatenate(([0.0], u, [0.0]))
+        return (-u_pad[:-2] + 2*u - u_pad[2:]) / dx**2 - 2.0 * np.exp(u)
+
+    func = CountingFunction(bratu)
+    return lambda: newton_system(func, np.zeros(size)), func
+
+
+# --- Linear systems: size = matrix order n ---
+@benchmark('gauss_elimination', sizes=[50, 100, 200])
+def _gauss_elimination_case(size):
+    A, b = _diagonally_dominant(size)
+    return lambda: gauss_elimination(A, b), None
+
+
+@benchmark('lu_decomposition', sizes=[50, 100, 200])
+def _lu_decomposition_case(size):
+    A, b = _diagonally_dominant(size)
+
+    def run():
+        L, U = lu_decomposition(A)
+        return lu_solve(L, U, b)
+    return run, None
+
+
+@benchmark('lu_decomposition_pivot', sizes=[50, 100, 200])
+def _lu_pivot_case(size):
+    A, b = _diagonally_dominant(size)
+
+    def run():
+        L, U, perm = lu_decomposition(A, pivot=True)
+        return lu_solve(L, U, b, perm)
+    return run, None
+
+
+@benchmark('gauss_seidel', sizes=[50, 100, 200])
+def _gauss_seidel_case(size):
+    A, b = _diagonally_dominant(size)
+    return lambda: gauss_seidel(A, b), None
+
+
+# --- Interpolation and regression: size = number of query or data points ---
+@benchmark('lagrange_interpolate', sizes=[100, 1000, 10000])
+def _lagrange_case(size):
+    x_knots = np.linspace(0, 6, 11)
+    y_knots = np.sin(x_knots)
+    x_query = np.linspace(0, 6, size)
+    return lambda: lagrange_interpolate(x_knots, y_knots, x_query), None
+
+
+@benchmark('cubic_spline', sizes=[1000, 10000, 100000])
+def _spline_case(size):
+    x_knots = np.linspace(0, 6, 101)
+    y_knots = np.sin(x_knots)
+    x_query = np.linspace(0, 6, size)
+    return lambda: generate_cubic_spline(x_knots, y_knots)(x_query), None
+
+
+@benchmark('least_squares_linear', sizes=[1000, 100000, 1000000])
+def _regression_case(size):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 10, size)
+    y = 2.0 + 0.5 * x + rng.normal(0, 0.1, size)
+    return lambda: least_squares_linear(x, y), None
+
+
+# --- Optimization: size = number of independent problems ---
+@benchmark('golden_section_search', sizes=[10, 100, 1000])
+def _golden_case(size):
+    shifts = np.linspace(0, 1, size)
+    func = CountingFunction(lambda x, s: (x - s)**2 / 10 - 2*np.sin(x - s))
+    return lambda: [golden_section_search(lambda x: func(x, s), 0, 4) for s in shifts], func
+
+
+@benchmark('parabolic_interpolation', sizes=[10, 100, 1000])
+def _parabolic_case(size):
+    shifts = np.linspace(0, 1, size)
+    func = CountingFunction(lambda x, s: (x - s)**2 / 10 - 2*np.sin(x - s))
+    return lambda: [parabolic_interpolation(lambda x: func(x, s), 0, 1, 4) for s in shifts], func
+
+
+# --- ODEs: size = number of time steps (or 1/tolerance for adaptive methods) ---
+@benchmark('euler_method', sizes=[1000, 10000, 100000])
+def _euler_case(size):
+    func = CountingFunction(_oscillator)
+    return lambda: euler_method(func, [1.0, 0.0], (0, 10), 10 / size), func
+
+
+@benchmark('rk4_method', sizes=[1000, 10000, 100000])
+def _rk4_case(size):
+    func = CountingFunction(_oscillator)
+    return lambda: rk4_method(func, [1.0, 0.0], (0, 10), 10 / size), func
+
+
+@benchmark('dopri45_method', sizes=[1000, 100000, 10000000])
+def _dopri_case(size):
+    func = CountingFunction(_oscillator)
+    return lambda: dopri45_method(func, [1.0, 0.0], (0, 10), rtol=1 / size, atol=1e-3 / size), func
+
+
+@benchmark('bdf_method', sizes=[100, 1000, 10000])
+def _bdf_case(size):
+    func = CountingFunction(_oscillator)
+    return lambda: bdf_method(func, [1.0, 0.0], (0, 10), 10 / size), func
+
+
+# --- Quadrature: size = 1/tolerance ---
+@benchmark('romberg', sizes=[1000, 1000000, 1000000000])
+def _romberg_case(size):
+    func = CountingFunction(lambda x: np.exp(-x**2))
+    return lambda: romberg(func, 0, 2, es=1 / size), func
+
+
+@benchmark('adaptive_quad', sizes=[1000, 1000000, 1000000000])
+def _adaptive_quad_case(size):
+    func = CountingFunction(lambda x: 1.0 / ((x - 0.3)**2 + 0.001))
+    return lambda: adaptive_quad(func, 0, 1, tol=1 / size, rtol=1 / size), func
+
+
+def measure(setup, size, repeat=3):
+    """
+    Runs one benchmark case at one size.
+
+    One untimed warm-up run comes first (caches, lazy imports). The time
+    is the best of `repeat` runs. nfev and peak memory come from one
+    extra run under tracemalloc, which is not timed because tracing slows
+    down allocations.
+
+    Returns:
+        dict with 'time', 'nfev' and 'peak_memory'.
+    """
+    run, counter = setup(size)
+    run()
+
+    best = np.inf
+    for _ in range(repeat):
+        run, counter = setup(size)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    run, counter = setup(size)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'time': best,
+            'nfev': None if counter is None else counter.calls,
+            'peak_memory': peak}
+
+
+def scaling_exponent(sizes, times):
+    """Least-squares slope of log(time) vs. log(size); None if undefined."""
+    sizes = np.asarray(sizes, dtype=float)
+    times = np.asarray(times, dtype=float)
+    if len(sizes) < 2 or np.any(times <= 0):
+        return None
+    return float(np.polyfit(np.log(sizes), np.log(times), 1)[0])
+
+
+def run_suite(names=None, repeat=3, quick=False):
+    """
+    Runs the selected benchmarks over their sizes.
+
+    Args:
+        names: Benchmark names to run (default: all).
+        repeat: Timed repeats per size.
+        quick: Only run the smallest size of every case.
+
+    Returns:
+        Results dict, ready to be written as JSON.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        setup, sizes = BENCHMARKS[name]
+        if quick:
+            sizes = sizes[:1]
+        runs = {str(size): measure(setup, size, repeat) for size in sizes}
+        results[name] = {
+            'sizes': runs,
+            'scaling_exponent': scaling_exponent(sizes, [r['time'] for r in runs.values()]),
+        }
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold=0.25, time_floor=1e-3):
+    """
+    Compares results with a baseline run of the suite.
+
+    A (benchmark, size) pair regresses if its time or peak memory exceeds
+    the baseline by more than the fraction `threshold`, or if its nfev
+    grew at all. Time differences below `time_floor` seconds are timer
+    noise and never count. Pairs missing from either run are skipped.
+
+    Returns:
+        List of (name, size, quantity, baseline value, new value) tuples.
+    """
+    regressions = []
+    for name, entry in results['results'].items():
+        old_entry = baseline['results'].get(name)
+        if old_entry is None:
+            continue
+        for size, new in entry['sizes'].items():
+            old = old_entry['sizes'].get(size)
+            if old is None:
+                continue
+            if new['time'] - old['time'] > max(threshold * old['time'], time_floor):
+                regressions.append((name, size, 'time', old['time'], new['time']))
+            if new['peak_memory'] > (1 + threshold) * old['peak_memory']:
+                regressions.append((name, size, 'peak_memory', old['peak_memory'], new['peak_memory']))
+            if new['nfev'] is not None and old['nfev'] is not None and new['nfev'] > old['nfev']:
+                regressions.append((name, size, 'nfev', old['nfev'], new['nfev']))
+    return regressions
+
+
+def print_results(results):
+    """Prints one table row per benchmark and size."""
+    print(f"{'BENCHMARK':<24} | {'SIZE':>10} | {'TIME (ms)':>10} | {'NFEV':>8} | "
+          f"{'PEAK MEM (kB)':>13} | {'SCALING'}")
+    print("-" * 90)
+    for name, entry in results['results'].items():
+        exponent = entry['scaling_exponent']
+        for k, (size, r) in enumerate(entry['sizes'].items()):
+            nfev = '-' if r['nfev'] is None else r['nfev']
+            scaling = f"n^{exponent:.2f}" if k == 0 and exponent is not None else ''
+            print(f"{name:<24} | {size:>10} | {1e3 * r['time']:>10.3f} | {nfev:>8} | "
+                  f"{r['peak_memory'] / 1e3:>13.1f} | {scaling}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every solver in the repository.")
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all). "
+                                                 f"Choices: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--output',
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             'benchmark_results.json'),
+                        help="JSON file for the results (default: next to this script).")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare with.")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help="Also write the results to PATH as the new baseline.")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative growth of time and memory (default: 0.25).")
+    parser.add_argument('--time-floor', type=float, default=1e-3,
+                        help="Ignore time differences below this many seconds (default: 1e-3).")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed repeats per size.")
+    parser.add_argument('--quick', action='store_true', help="Only run the smallest size.")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    # Read the baseline before anything is written: it may be the file that
+    # --output (or --save-baseline) is about to overwrite
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    results = run_suite(args.names, repeat=args.repeat, quick=args.quick)
+    print_results(results)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w') as file:
+            json.dump(results, file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.time_floor)
+        print(f"\nComparison with {args.baseline} (threshold {args.threshold:.0%})")
+        if not regressions:
+            print("No regressions.")
+        for name, size, quantity, old, new in regressions:
+            print(f"REGRESSION {name} [size {size}] {quantity}: {old:.4g} -> {new:.4g} "
+                  f"({new / old - 1:+.0%})")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,351 @@
+"""
+convergence_analysis.py
+--------------------------------
+Convergence Analysis for the Iterative Solvers in the Repository.
+
+Summary:
+Solvers are analyzed as they are, without copies. The problem function
+is wrapped in a Trace before it is passed to the solver. Every call
+through the Trace is counted and time-stamped. A point that has not
+been evaluated before updates the current estimate of the solution,
+chosen by the estimate policy:
+    'latest'  : the newest point (bisection midpoints, Newton iterates)
+    'min_abs' : the point with the smallest |f| so far (root finders that
+                also evaluate auxiliary points, e.g. finite differences)
+    'min'     : the point with the smallest f so far (minimizers)
+Each change of the estimate is recorded with its true error, the
+evaluation count (function plus derivative calls) and the elapsed time.
+
+From the error history e_k the empirical order of convergence q and the
+rate constant C are fitted from
+    e_(k+1) ≈ C · e_k^q
+(q = 1 linear, q = 2 quadratic), and the cost to reach a tolerance is
+read off as the first record with e_k <= tol.
+
+For ODE solvers, refinement_study runs a method over a list of step
+sizes instead; the order is the slope of log(error) against log(h).
+
+Batches of problems can be analyzed in parallel processes (run_batch).
+
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+ESTIMATE_POLICIES = ('latest', 'min_abs', 'min')
+
+
+class Trace:
+    """
+    Wraps a problem function, counting calls and recording the solver's
+    estimates of the solution (see the module docstring).
+
+    With estimate=None the Trace only counts calls, e.g. for a derivative.
+    """
+
+    def __init__(self, func, exact=None, estimate='latest', error=None):
+        if estimate is not None and estimate not in ESTIMATE_POLICIES:
+            raise ValueError(f"estimate must be one of {ESTIMATE_POLICIES} or None.")
+        self.func = func
+        self.exact = exact
+        self.estimate = estimate
+        self.error = error if error is not None else _default_error
+        self.others = []        # count-only Traces, e.g. of the derivative
+        self.calls = 0
+        self._seen = set()
+        self._best = None
+        self._best_value = np.inf
+        self.start = time.perf_counter()
+
+        self.estimates = []
+        self.errors = []
+        self.evaluations = []   # cumulative calls, including self.others
+        self.times = []         # seconds since start
+
+    def __call__(self, x, *args):
+        fx = self.func(x, *args)
+        self.calls += 1
+        if self.estimate is None:
+            return fx
+
+        key = np.asarray(x, dtype=float).tobytes()
+        if key in self._seen:
+            return fx
+        self._seen.add(key)
+
+        if self.estimate == 'latest':
+            value = None
+        elif self.estimate == 'min_abs':
+            value = np.linalg.norm(np.atleast_1d(fx))
+        else:
+            value = float(fx)
+        if value is not None and not value < self._best_value:
+            return fx
+        self._best_value = value if value is not None else np.inf
+        self._best = np.array(x, dtype=float)
+
+        self.estimates.append(self._best)
+        self.errors.append(np.nan if self.exact is None else self.error(self._best, self.exact))
+        self.evaluations.append(self.calls + sum(other.calls for other in self.others))
+        self.times.append(time.perf_counter() - self.start)
+        return fx
+
+    def counter(self, func):
+        """Returns a count-only Trace of func whose calls add to the cost."""
+        other = Trace(func, estimate=None)
+        self.others.append(other)
+        return other
+
+
+def _default_error(estimate, exact):
+    """Absolute error (max norm for vectors)."""
+    return float(np.max(np.abs(np.asarray(estimate) - np.asarray(exact))))
+
+
+def empirical_order(errors, n_tail=None, floor=1e-13):
+    """
+    Fits e_(k+1) ≈ C · e_k^q to an error history.
+
+    Only pairs with both errors above `floor` are used, so round-off does
+    not flatten the fit. n_tail limits the fit to the last n_tail pairs.
+    Errors of bracketing methods do not decrease monotonically, and their
+    fit needs the whole history to settle near q = 1.
+
+    Returns:
+        (q, C), or (None, None) if fewer than two usable pairs exist.
+    """
+    e = np.asarray(errors, dtype=float)
+    e = e[np.isfinite(e)]
+    pairs = [(e[k], e[k+1]) for k in range(len(e) - 1)
+             if e[k] > floor and e[k+1] > floor and e[k] != e[k+1]]
+    if n_tail is not None:
+        pairs = pairs[-n_tail:]
+    if len(pairs) < 2:
+        return None, None
+    log_e = np.log(np.array(pairs))
+    q, log_c = np.polyfit(log_e[:, 0], log_e[:, 1], 1)
+    return float(q), float(np.exp(log_c))
+
+
+def cost_to_tolerance(errors, evaluations, times, tol):
+    """
+    Evaluations and time until the error first drops to tol or below.
+
+    Returns:
+        (evaluations, seconds), or (None, None) if tol is never reached.
+    """
+    for e, n, t in zip(errors, evaluations, times):
+        if e <= tol:
+            return n, t
+    return None, None
+
+
+def analyze(solver, func, *args, exact=None, estimate='latest', error=None,
+            tolerances=(1e-4, 1e-8, 1e-12), **kwargs):
+    """
+    Runs solver(func, *args, **kwargs) on a traced func and summarizes it.
+
+    Further callables among args (derivatives, for example) are counted
+    as part of the cost.
+
+    Args:
+        solver: Any solver of the repository taking the problem function
+                as its first argument.
+        func: Problem function.
+        *args, **kwargs: Remaining solver arguments.
+        exact: True solution, for the error history.
+        estimate: Estimate policy, see ESTIMATE_POLICIES.
+        error: Optional error function error(estimate, exact).
+        tolerances: Tolerances for the cost-to-tolerance table.
+
+    Returns:
+        dict with the solver output ('result'), the history ('estimates',
+        'errors', 'evaluations', 'times'), the totals ('nfev', 'time'),
+        'order', 'rate' and 'cost' ({tol: (evaluations, seconds)}).
+    """
+    trace = Trace(func, exact, estimate, error)
+    args = [trace.counter(arg) if callable(arg) else arg for arg in args]
+    result = solver(trace, *args, **kwargs)
+    elapsed = time.perf_counter() - trace.start
+
+    order, rate = empirical_order(trace.errors)
+    return {
+        'result': result,
+        'estimates': trace.estimates,
+        'errors': trace.errors,
+        'evaluations': trace.evaluations,
+        'times': trace.times,
+        'nfev': trace.calls + sum(other.calls for other in trace.others),
+        'time': elapsed,
+        'order': order,
+        'rate': rate,
+        'cost': {tol: cost_to_tolerance(trace.errors, trace.evaluations, trace.times, tol)
+                 for tol in tolerances},
+    }
+
+
+def refinement_study(method, dydt, y0, t_span, steps, exact, tolerances=(1e-4, 1e-8),
+                     **kwargs):
+    """
+    Step-size refinement study of a fixed-step ODE method.
+
+    Args:
+        method: ODE solver method(dydt, y0, t_span, h, **kwargs) returning
+                t_values, y_values (further return values are ignored).
+        dydt, y0, t_span: The initial value problem.
+        steps: Step sizes to run, largest first.
+        exact: Exact solution at t_end.
+        tolerances: Tolerances for the cost-to-tolerance table.
+
+    Returns:
+        dict with 'steps', 'errors', 'evaluations', 'times', the fitted
+        'order' (slope of log error vs. log h), the 'pairwise' orders
+        between successive step sizes and 'cost' ({tol: (evaluations, seconds)}).
+    """
+    errors, evaluations, times = [], [], []
+    for h in steps:
+        counter = Trace(dydt, estimate=None)
+        start = time.perf_counter()
+        output = method(counter, y0, t_span, h, **kwargs)
+        times.append(time.perf_counter() - start)
+        errors.append(_default_error(output[1][-1], exact))
+        evaluations.append(counter.calls)
+
+    log_h = np.log(np.asarray(steps, dtype=float))
+    log_e = np.log(np.maximum(errors, np.finfo(float).tiny))
+    pairwise = list(np.diff(log_e) / np.diff(log_h))
+    order = float(np.polyfit(log_h, log_e, 1)[0]) if len(steps) > 1 else None
+
+    # Cost to tolerance: the cheapest run that meets it
+    cost = {}
+    for tol in tolerances:
+        passing = [(n, t) for e, n, t in zip(errors, evaluations, times) if e <= tol]
+        cost[tol] = min(passing) if passing else (None, None)
+
+    return {'steps': list(steps), 'errors': errors, 'evaluations': evaluations,
+            'times': times, 'order': order, 'pairwise': pairwise, 'cost': cost}
+
+
+def _run_problem(problem):
+    """Runs one batch entry (in a worker process when run in parallel)."""
+    problem = dict(problem)
+    name = problem.pop('name')
+    study = problem.pop('study', 'iterative')
+    if study == 'refinement':
+        return name, refinement_study(**problem)
+    solver = problem.pop('solver')
+    func = problem.pop('func')
+    args = problem.pop('args', ())
+    return name, analyze(solver, func, *args, **problem)
+
+
+def run_batch(problems, n_workers=1):
+    """
+    Analyzes a batch of problems, optionally in parallel processes.
+
+    Args:
+        problems: List of dicts. Each has a 'name', an optional 'study'
+                  ('iterative', the default, or 'refinement') and the
+                  arguments of analyze ('solver', 'func', 'args', ...) or
+                  of refinement_study. Functions must be picklable
+                  (module-level or functools.partial) when n_workers > 1.
+        n_workers: Number of processes.
+
+    Returns:
+        dict mapping problem names to their analysis results, in order.
+    """
+    if n_workers <= 1:
+        return dict(_run_problem(problem) for problem in problems)
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return dict(pool.map(_run_problem, problems))
+
+
+def print_summary(results, tol=1e-8):
+    """Prints order, total cost and cost to tol for every analyzed problem."""
+    width = max(len('PROBLEM'), *(len(name) for name in results))
+    print(f"{'PROBLEM':<{width}} | {'ORDER':>6} | {'NFEV':>7} | {'TIME (ms)':>9} | "
+          f"{f'NFEV TO {tol:.0e}':>13} | {f'MS TO {tol:.0e}':>11}")
+    print("-" * (width + 62))
+    for name, r in results.items():
+        order = '-' if r['order'] is None else f"{r['order']:.2f}"
+        nfev = r['nfev'] if 'nfev' in r else sum(r['evaluations'])
+        elapsed = r['time'] if 'time' in r else sum(r['times'])
+        n_tol, t_tol = r['cost'].get(tol, (None, None))
+        n_tol = '-' if n_tol is None else n_tol
+        t_tol = '-' if t_tol is None else f"{1e3 * t_tol:.3f}"
+        print(f"{name:<{width}} | {order:>6} | {nfev:>7} | {1e3 * elapsed:>9.3f} | "
+              f"{n_tol:>13} | {t_tol:>11}")
+
+
+# --- Test problems (module level, so batches can run in other processes) ---
+def cubic(x):
+    """f(x) = x^3 - x - 1, root at the plastic number."""
+    return x**3 - x - 1
+
+
+def d_cubic(x):
+    """f'(x) = 3x^2 - 1."""
+    return 3*x**2 - 1
+
+
+CUBIC_ROOT = 1.324717957244746
+
+
+def cost_function(x):
+    """f(x) = x^2/10 - 2 sin(x), minimum near x = 1.4276 (see optimization/)."""
+    return x**2 / 10 - 2*np.sin(x)
+
+
+def oscillator(t, y):
+    """y'' = -y as a system; y(t) = [cos t, -sin t] for y(0) = [1, 0]."""
+    return np.array([y[1], -y[0]])
+
+
+if __name__ == "__main__":
+    from anmx.root_finding.bisection_method import bisection
+    from anmx.root_finding.newton_raphson import newton_raphson
+    from anmx.root_finding.newton_systems import newton_system, f as chapra_system
+    from anmx.optimization.golden_section_search import golden_section_search
+    from anmx.optimization.parabolic_interpolation import parabolic_interpolation
+    from anmx.ordinary_differential_equations.euler_method import euler_method
+    from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+    from anmx.ordinary_differential_equations.implicit_methods import trapezoidal_method
+
+    # Minimum of cost_function from f'(x) = x/5 - 2cos(x) = 0
+    x_min = newton_raphson(lambda x: x/5 - 2*np.cos(x), lambda x: 0.2 + 2*np.sin(x),
+                           1.5, es=1e-15)[0]
+    steps = [0.1, 0.05, 0.025, 0.0125, 0.00625]
+
+    problems = [
+        {'name': 'bisection', 'solver': bisection, 'func': cubic, 'args': (1, 2),
+         'exact': CUBIC_ROOT, 'es': 1e-15},
+        {'name': 'newton_raphson', 'solver': newton_raphson, 'func': cubic,
+         'args': (d_cubic, 1.0), 'exact': CUBIC_ROOT, 'es': 1e-15},
+        {'name': 'newton_system (chord)', 'solver': newton_system, 'func': chapra_system,
+         'args': ([1.5, 3.5],), 'exact': [2.0, 3.0], 'estimate': 'min_abs', 'mode': 'chord'},
+        {'name': 'newton_system (broyden)', 'solver': newton_system, 'func': chapra_system,
+         'args': ([1.5, 3.5],), 'exact': [2.0, 3.0], 'estimate': 'min_abs', 'mode': 'broyden'},
+        {'name': 'golden_section_search', 'solver': golden_section_search,
+         'func': cost_function, 'args': (0, 4), 'exact': x_min, 'estimate': 'min',
+         'tol': 1e-10, 'max_iter': 100},
+        {'name': 'parabolic_interpolation', 'solver': parabolic_interpolation,
+         'func': cost_function, 'args': (0, 1, 4), 'exact': x_min, 'estimate': 'min',
+         'tol': 1e-8},
+    ]
+    for name, method in (('euler_method', euler_method), ('rk4_method', rk4_method),
+                         ('trapezoidal_method', trapezoidal_method)):
+        problems.append({'name': f"{name} (h refinement)", 'study': 'refinement',
+                         'method': method, 'dydt': oscillator, 'y0': [1.0, 0.0],
+                         't_span': (0, 10), 'steps': steps,
+                         'exact': [np.cos(10.0), -np.sin(10.0)]})
+
+    start = time.perf_counter()
+    results = run_batch(problems, n_workers=4)
+    elapsed = time.perf_counter() - start
+
+    print(f"Convergence Analysis ({len(problems)} problems, 4 workers, {elapsed:.2f} s)")
+    print("-----------------------------------------------")
+    print_summary(results)
+    print("\nOrders are iterative orders q (e_(k+1) ≈ C·e_k^q) for solvers, "
+          "and slopes of log(error) vs. log(h) for ODE methods.")
@@ -0,0 +1,129 @@
+"""
+import_time.py
+--------------------------------
+Import-Time Check for the anmx Package.
+
+Summary:
+Short-lived worker processes pay for every import at startup, so importing
+a solver must not drag in SciPy or matplotlib. For each target module a
+fresh interpreter is spawned (nothing cached in sys.modules) and the wall
+time of the import statement is measured; the best of several runs is
+reported. The child also reports which heavy libraries ended up in
+sys.modules. A target fails if it imported a forbidden library or if its
+import time is above the budget.
+
+Usage:
+    python -m anmx.benchmarks.import_time
+    python -m anmx.benchmarks.import_time --budget 0.15 --repeat 5
+The exit status is 1 if any target failed.
+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Libraries that only plotting and reference functions may import
+HEAVY_MODULES = ('scipy', 'matplotlib', 'PIL')
+
+TARGETS = [
+    'anmx',
+    'anmx.root_finding.bisection_method',
+    'anmx.root_finding.newton_raphson',
+    'anmx.root_finding.newton_systems',
+    'anmx.linear_systems.gauss_elimination',
+    'anmx.linear_systems.gauss_seidel',
+    'anmx.linear_systems.lu_decomposition',
+    'anmx.curve_fitting_interpolation.lagrange_interpolation',
+    'anmx.curve_fitting_interpolation.linear_regression',
+    'anmx.curve_fitting_interpolation.splines',
+    'anmx.curve_fitting_interpolation.compare_fitting',
+    'anmx.optimization.golden_section_search',
+    'anmx.optimization.parabolic_interpolation',
+    'anmx.optimization.compare_optimization',
+    'anmx.numerical_integration.adaptive_quadrature',
+    'anmx.numerical_integration.romberg',
+    'anmx.ordinary_differential_equations.runge_kutta_4',
+    'anmx.ordinary_differential_equations.dormand_prince',
+    'anmx.ordinary_differential_equations.implicit_methods',
+    'anmx.ordinary_differential_equations.shooting_method',
+    'anmx.ordinary_differential_equations.bungee_simulation',
+]
+
+# Runs in the child: numpy is imported first so that its (unavoidable) cost
+# is not charged to every target, then only the target import is timed.
+_CHILD = """
+import json, sys, time
+import numpy
+t0 = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - t0
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{'time': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure_import(target, repeat=3):
+    """
+    Times `import target` in fresh interpreters.
+
+    Args:
+        target (str): Dotted module name.
+        repeat (int): Number of fresh interpreters; the best time is kept.
+
+    Returns:
+        tuple: (best_time, heavy_modules), where heavy_modules lists the
+        entries of HEAVY_MODULES present in sys.modules after the import.
+
+    Raises:
+        RuntimeError: If the import fails in the child interpreter.
+    """
+    code = _CHILD.format(target=target, heavy=HEAVY_MODULES)
+    best, heavy = float('inf'), []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {target} failed:\n{proc.stderr}")
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        best = min(best, result['time'])
+        heavy = result['heavy']
+    return best, heavy
+
+
+def check(targets=TARGETS, budget=0.2, repeat=3):
+    """
+    Measures every target and applies the budget.
+
+    Returns:
+        list: One dict per target with 'target', 'time', 'heavy' and 'ok'.
+    """
+    rows = []
+    for target in targets:
+        t, heavy = measure_import(target, repeat)
+        rows.append({'target': target, 'time': t, 'heavy': heavy,
+                     'ok': not heavy and t <= budget})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import time of the anmx modules.")
+    parser.add_argument('targets', nargs='*', help="Modules to check (default: all).")
+    parser.add_argument('--budget', type=float, default=0.2,
+                        help="Maximum import time per module in seconds, numpy excluded.")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per module.")
+    args = parser.parse_args()
+
+    rows = check(args.targets or TARGETS, args.budget, args.repeat)
+
+    print(f"{'MODULE':<58} | {'TIME (ms)':>9} | {'HEAVY IMPORTS'}")
+    print("-" * 90)
+    for row in rows:
+        flag = '' if row['ok'] else '  <-- FAIL'
+        heavy = ', '.join(row['heavy']) or '-'
+        print(f"{row['target']:<58} | {row['time'] * 1e3:>9.2f} | {heavy}{flag}")
+
+    failed = [row for row in rows if not row['ok']]
+    print(f"\n{len(failed)} of {len(rows)} modules over budget ({args.budget * 1e3:.0f} ms) "
+          f"or importing {', '.join(HEAVY_MODULES)}.")
+    sys.exit(1 if failed else 0)
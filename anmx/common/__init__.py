@@ -0,0 +1 @@
+"""Shared helpers used across the solver modules (instrumentation, warnings, result cache)."""
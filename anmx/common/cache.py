@@ -0,0 +1,509 @@
+"""
+cache.py
+--------------------------------
+Persistent, Content-Addressed Result Cache for the Solver Entry Points.
+
+Summary:
+memoize(func) returns a version of a solver whose results are kept on
+disk. The cache key is a SHA-256 digest of
+    - the code identity of the solver: its bytecode, constants, defaults,
+      captured variables and, recursively, the globals it refers to
+      (so editing rk4_step invalidates cached rk4_method results),
+    - every argument, bound to the signature so f(y0, h=0.1) and
+      f(y0, 0.1) share a key: array dtype, shape and bytes; numbers and
+      strings; containers element by element; functions by the same
+      code identity as the solver (so bungee_jumper_ode or beam_ode with
+      a changed constant is a different key).
+An argument, captured variable or referenced global that cannot be
+hashed by content (an open file, a Tracer callback, an instance of a
+user class, ...) raises TypeError; list such parameters in ignore= if they
+do not affect the result (e.g. n_workers).
+
+Each result is stored as one uncompressed .npz file named by its key.
+Arrays are stored as they are; tuples, lists, dicts and Python scalars
+are recorded in a small JSON structure entry next to them, so (t, y) or
+(t, y, t_events, y_events) come back with the same shape.
+
+Caching is opt-in: nothing is cached unless a function is wrapped.
+
+Concurrency:
+Any number of processes may share one cache directory.
+    - Writers save to a temporary file in the same directory and publish
+      it with os.replace, which is atomic: a reader sees either the whole
+      file or no file.
+    - Readers load the whole file into memory, so an entry removed by
+      eviction in the meantime is not a problem; a missing or unreadable
+      file is simply a miss.
+    - LRU order is the file modification time, refreshed on every hit.
+    - Eviction (oldest first, until the total size is below max_bytes)
+      runs after a store and is serialized with an exclusive lock on a
+      lock file in the directory.
+
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+import types
+import warnings
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_MAX_BYTES = 1 << 30   # 1 GiB
+SUFFIX = '.npz'
+_STRUCTURE = '__structure__'
+_PLAIN_TYPES = (bool, int, float, str, type(None))
+
+
+def default_directory():
+    """Cache directory: $ANMX_CACHE_DIR, else ~/.cache/anmx."""
+    return os.environ.get('ANMX_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'anmx'))
+
+
+# --- Hashing ---
+
+def _update(h, tag, data=b''):
+    """Feeds a type tag and a length-prefixed payload, so fields cannot run together."""
+    if isinstance(data, str):
+        data = data.encode()
+    h.update(tag.encode() + len(data).to_bytes(8, 'little') + data)
+
+
+def _hash_code(h, code, seen):
+    _update(h, 'code', code.co_code)
+    _update(h, 'names', repr(code.co_names))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(h, const, seen)
+        else:
+            _update(h, 'const', repr(const))
+
+
+def _hash_function(h, func, seen):
+    """Code identity of a function, including what it refers to."""
+    if id(func) in seen:
+        _update(h, 'ref', func.__qualname__)
+        return
+    seen.add(id(func))
+    _update(h, 'func', f"{func.__module__}.{func.__qualname__}")
+    code = func.__code__
+    _hash_code(h, code, seen)
+    _hash_value(h, func.__defaults__, seen)
+    _hash_value(h, func.__kwdefaults__, seen)
+    # Attributes such as the terminal/direction marks set by @event
+    _hash_value(h, dict(func.__dict__), seen)
+    # Captured variables are part of the result: one that cannot be hashed
+    # by content raises TypeError instead of giving a key that ignores it
+    for cell in func.__closure__ or ():
+        _hash_value(h, cell.cell_contents, seen)
+    # Globals named in the code (nested code objects included) are hashed
+    # by content like arguments; modules, classes and builtins by name only
+    names, stack = [], [code]
+    while stack:
+        c = stack.pop()
+        names.extend(c.co_names)
+        stack.extend(k for k in c.co_consts if isinstance(k, types.CodeType))
+    for name in sorted(set(names)):
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        _update(h, 'global', name)
+        _hash_value(h, value, seen)
+
+
+def _hash_value(h, obj, seen):
+    """Feeds the content of one argument to the hash, or raises TypeError."""
+    if isinstance(obj, _PLAIN_TYPES) or isinstance(obj, (complex, bytes)):
+        _update(h, type(obj).__name__, repr(obj))
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        arr = np.asarray(obj)
+        if arr.dtype.hasobject:
+            raise TypeError("object arrays cannot be hashed by content")
+        _update(h, 'ndarray', f"{arr.dtype.str}{arr.shape}")
+        _update(h, 'data', np.ascontiguousarray(arr).tobytes())
+    elif isinstance(obj, (tuple, list)):
+        _update(h, type(obj).__name__, str(len(obj)))
+        for item in obj:
+            _hash_value(h, item, seen)
+    elif isinstance(obj, dict):
+        _update(h, 'dict', str(len(obj)))
+        for key in sorted(obj, key=repr):
+            _hash_value(h, key, seen)
+            _hash_value(h, obj[key], seen)
+    elif isinstance(obj, types.FunctionType):
+        _hash_function(h, obj, seen)
+    elif isinstance(obj, functools.partial):
+        _update(h, 'partial')
+        _hash_value(h, (obj.func, obj.args, obj.keywords), seen)
+    elif isinstance(getattr(obj, '__wrapped__', None), types.FunctionType):
+        # Decorated functions such as functools.lru_cache wrappers
+        _update(h, 'wrapped', type(obj).__qualname__)
+        _hash_function(h, obj.__wrapped__, seen)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc, types.ModuleType, type)):
+        _update(h, 'named', f"{getattr(obj, '__module__', '')}.{obj.__name__}")
+    else:
+        raise TypeError(f"cannot hash an argument of type {type(obj).__qualname__} "
+                        f"by content; pass it in ignore= if it does not affect the result")
+
+
+def make_key(func, bound_arguments):
+    """
+    Hex digest identifying func called with the given arguments.
+
+    Args:
+        func: The (unwrapped) function.
+        bound_arguments: Mapping of parameter name to value.
+    """
+    h = hashlib.sha256()
+    seen = set()
+    _hash_function(h, func, seen)
+    for name, value in bound_arguments.items():
+        _update(h, 'arg', name)
+        _hash_value(h, value, seen)
+    return h.hexdigest()
+
+
+# --- Serialization ---
+
+def _pack(obj, arrays):
+    """JSON-able description of obj; its arrays are appended to `arrays`."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("object arrays cannot be stored")
+        arrays.append(obj)
+        return {'t': 'array', 'i': len(arrays) - 1}
+    if isinstance(obj, (np.generic, complex)):
+        arrays.append(np.asarray(obj))
+        return {'t': 'scalar', 'i': len(arrays) - 1, 'py': isinstance(obj, complex)}
+    if isinstance(obj, _PLAIN_TYPES):
+        return {'t': 'plain', 'v': obj}
+    if isinstance(obj, (tuple, list)):
+        return {'t': type(obj).__name__, 'items': [_pack(item, arrays) for item in obj]}
+    if isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+        return {'t': 'dict', 'items': {k: _pack(v, arrays) for k, v in obj.items()}}
+    raise TypeError(f"cannot store a result of type {type(obj).__qualname__}")
+
+
+def _unpack(spec, arrays):
+    kind = spec['t']
+    if kind == 'array':
+        return arrays[f"a{spec['i']}"]
+    if kind == 'scalar':
+        value = arrays[f"a{spec['i']}"][()]
+        return value.item() if spec['py'] else value
+    if kind == 'plain':
+        return spec['v']
+    if kind == 'tuple':
+        return tuple(_unpack(s, arrays) for s in spec['items'])
+    if kind == 'list':
+        return [_unpack(s, arrays) for s in spec['items']]
+    return {k: _unpack(s, arrays) for k, s in spec['items'].items()}
+
+
+class _DirectoryLock:
+    """Exclusive inter-process lock held on a lock file in the cache directory."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(self.fd, msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self.fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+        os.close(self.fd)
+
+
+class ResultCache:
+    """
+    Directory of .npz results addressed by key, with size-bounded LRU eviction.
+
+    Args:
+        directory: Cache directory (created if needed). Default: default_directory().
+        max_bytes: Total size above which the least recently used entries are
+                   removed after a store.
+        stale_tmp_age: Temporary files of crashed writers older than this
+                       (seconds) are removed during eviction.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, stale_tmp_age=3600.0):
+        self.directory = os.path.abspath(directory or default_directory())
+        self.max_bytes = max_bytes
+        self.stale_tmp_age = stale_tmp_age
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, key):
+        """
+        Returns (True, result) for a stored key, or (False, None) on a miss.
+
+        A hit refreshes the entry's position in the LRU order.
+        """
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            spec = json.loads(str(arrays.pop(_STRUCTURE)))
+            result = _unpack(spec, arrays)
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except (OSError, ValueError, KeyError):
+            # Unreadable entry (e.g. a disk filled up mid-write): drop it
+            self._remove(path)
+            self.misses += 1
+            return False, None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted meanwhile; the result is already in memory
+        self.hits += 1
+        return True, result
+
+    def store(self, key, result):
+        """
+        Saves result under key (atomically) and evicts if over max_bytes.
+
+        Raises:
+            TypeError: If result contains something other than arrays,
+                       scalars, strings, None, tuples, lists or str-keyed dicts.
+        """
+        arrays = []
+        spec = _pack(result, arrays)
+        payload = {f"a{i}": arr for i, arr in enumerate(arrays)}
+        payload[_STRUCTURE] = np.array(json.dumps(spec))
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **payload)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            self._remove(tmp)
+            raise
+        if self.size() > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """(mtime, size, path) of every entry."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith(SUFFIX):
+                    try:
+                        st = e.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, e.path))
+        return entries
+
+    def size(self):
+        """Total bytes held by the entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+    def evict(self, max_bytes=None):
+        """
+        Removes least recently used entries until the total is at most max_bytes.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        with _DirectoryLock(os.path.join(self.directory, '.lock')):
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= limit:
+                    break
+                if self._remove(path):
+                    removed += 1
+                total -= size
+            self._remove_stale_tmp()
+        return removed
+
+    def clear(self):
+        """Removes every entry."""
+        return self.evict(max_bytes=0)
+
+    def _remove_stale_tmp(self):
+        cutoff = time.time() - self.stale_tmp_age
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith('.tmp'):
+                    try:
+                        if e.stat().st_mtime < cutoff:
+                            self._remove(e.path)
+                    except FileNotFoundError:
+                        pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+
+def memoize(func=None, cache=None, ignore=()):
+    """
+    Wraps a solver so that repeated calls with identical inputs are read from disk.
+
+    Can be used as a plain call, memoize(rk4_method), or as a decorator,
+    @memoize(cache=ResultCache('/scratch/anmx', max_bytes=10 << 30)).
+
+    Args:
+        func: Function to wrap.
+        cache: ResultCache to use. Default: one in default_directory().
+        ignore: Names of parameters left out of the key because they do
+                not change the result (worker counts, callbacks, ...).
+
+    Returns:
+        The wrapped function. It has the attributes `cache` and
+        `uncached` (the original function).
+    """
+    def wrap(f):
+        signature = inspect.signature(f)
+        store = cache if cache is not None else ResultCache()
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k not in ignore}
+            key = make_key(f, arguments)
+
+            found, result = store.load(key)
+            if found:
+                return result
+            result = f(*args, **kwargs)
+            try:
+                store.store(key, result)
+            except TypeError as exc:
+                warnings.warn(f"{f.__qualname__}: result not cached ({exc})",
+                              RuntimeWarning, stacklevel=2)
+            return result
+
+        wrapper.cache = store
+        wrapper.uncached = f
+        return wrapper
+
+    if func is None:
+        return wrap
+    return wrap(func)
+
+
+if __name__ == "__main__":
+    import shutil
+    from concurrent.futures import ProcessPoolExecutor
+    from anmx.curve_fitting_interpolation.linear_regression import least_squares_linear
+    from anmx.ordinary_differential_equations.bungee_simulation import (
+        bungee_jumper_ode, cord_taut, max_fall)
+    from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+    from anmx.ordinary_differential_equations.shooting_method import (
+        multiple_shooting, beam_ode, beam_bc)
+
+    directory = tempfile.mkdtemp(prefix='anmx-cache-')
+    store = ResultCache(directory, max_bytes=50 << 20)
+
+    cached_rk4 = memoize(rk4_method, cache=store)
+    cached_shooting = memoize(multiple_shooting, cache=store, ignore=('n_workers',))
+    cached_regression = memoize(least_squares_linear, cache=store)
+
+    def digest(result):
+        h = hashlib.sha256()
+        _hash_value(h, result, set())
+        return h.hexdigest()
+
+    rng = np.random.default_rng(0)
+    x_data = np.linspace(0, 10, 200_000)
+    y_data = 2.0 + 0.5 * x_data + rng.normal(0, 1, x_data.size)
+
+    cases = [
+        ("Bungee jump (RK4, h = 0.01)", cached_rk4,
+         (bungee_jumper_ode, np.array([0.0, 0.0]), (0, 50), 0.01),
+         {'events': [cord_taut, max_fall]}),
+        ("Beam (multiple shooting)", cached_shooting,
+         (beam_ode, (0, 400.0), beam_bc, np.zeros(4), 1.0), {}),
+        ("Linear regression (200k points)", cached_regression, (x_data, y_data), {}),
+    ]
+
+    print(f"Cache directory: {directory}")
+    print(f"{'CASE':<32} | {'SOLVE (ms)':>10} | {'LOOKUP (ms)':>11} | {'IDENTICAL'}")
+    print("-" * 72)
+    for name, func, args, kwargs in cases:
+        start = time.perf_counter()
+        first = func(*args, **kwargs)
+        solve = time.perf_counter() - start
+        start = time.perf_counter()
+        second = func(*args, **kwargs)
+        lookup = time.perf_counter() - start
+        print(f"{name:<32} | {solve * 1e3:>10.2f} | {lookup * 1e3:>11.2f} | "
+              f"{digest(first) == digest(second)}")
+    print(f"\nHits: {store.hits}, misses: {store.misses}, "
+          f"{len(store)} entries, {store.size() / 1e6:.2f} MB")
+
+    # A closure over an object that cannot be hashed by content is refused,
+    # rather than cached under a key that ignores the captured value
+    class Decay:
+        def __init__(self, k):
+            self.k = k
+
+    def make_rhs(p):
+        return lambda t, y: -p.k * y
+
+    try:
+        cached_rk4(make_rhs(Decay(1.0)), 1.0, (0, 1), 0.01)
+    except TypeError as exc:
+        print(f"Closure over a Decay instance: TypeError ({exc})")
+    # Capturing plain values works: k = 1 and k = 5 are different keys
+    def make_decay(k):
+        return lambda t, y: -k * y
+
+    for k in (1.0, 5.0):
+        t, y = cached_rk4(make_decay(k), 1.0, (0, 1), 0.01)
+        print(f"dy/dt = -{k:g} y: y(1) = {y[-1]:.6f} (exact {np.exp(-k):.6f})")
+    print()
+
+    # Worker processes with their own ResultCache on the same directory
+    # share entries: once a step size has been solved by any worker, the
+    # other workers read it instead of solving it again
+    def jump(h):
+        solver = memoize(rk4_method, cache=ResultCache(directory))
+        t, y = solver(bungee_jumper_ode, np.array([0.0, 0.0]), (0, 50), h)
+        return float(y[-1, 0]), solver.cache.hits
+
+    steps = [0.02, 0.01, 0.005] * 4
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(jump, steps))
+    print(f"{len(steps)} runs in 4 processes, {sum(hits for _, hits in results)} served from the cache; "
+          f"final positions {sorted({round(x, 6) for x, _ in results})}")
+
+    shutil.rmtree(directory)
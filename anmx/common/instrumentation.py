@@ -0,0 +1,159 @@
+"""
+instrumentation.py
+--------------------------------
+Instrumentation Hooks for the Iterative Solvers.
+
+Summary:
+Iterative solvers accept an optional callback(state). It is called once
+per iteration with a dict describing the iteration. Every state has
+    'solver'    : name of the solver
+    'iteration' : iteration number (1, 2, ...)
+    'x'         : current estimate
+    'error'     : the solver's own convergence measure
+plus solver-specific entries (the bracket, f(x), ...). With the default
+callback=None the only cost is one `is not None` test per iteration, so
+the hooks can stay in hot loops.
+
+Tracer is a ready-made callback. It keeps the states with timestamps,
+counts function evaluations through wrap(func) and can log each
+iteration to a logging.Logger.
+
+Failures to converge are reported as a ConvergenceWarning (through the
+warnings module) instead of a printed message. Callers choose the policy:
+    warnings.simplefilter('ignore', ConvergenceWarning)   # silence
+    warnings.simplefilter('error', ConvergenceWarning)    # raise instead
+The warning carries the solver name, iteration count, last error and a
+reason code ('maxit', 'degenerate', ...), so it can be handled in code.
+
+"""
+
+import logging
+import time
+import warnings
+import numpy as np
+
+
+class ConvergenceWarning(UserWarning):
+    """A solver stopped without meeting its convergence criterion."""
+
+    def __init__(self, message, solver=None, iterations=None, error=None, reason='maxit'):
+        super().__init__(message)
+        self.solver = solver
+        self.iterations = iterations
+        self.error = error
+        self.reason = reason
+
+
+def warn_not_converged(solver, iterations, error=None, reason='maxit', message=None,
+                       stacklevel=3):
+    """
+    Issues a ConvergenceWarning on behalf of a solver.
+
+    stacklevel=3 attributes the warning to the caller of the solver.
+    """
+    if message is None:
+        message = f"{solver}: maximum iterations ({iterations}) reached"
+        if error is not None:
+            message += f", error {error:.3e}"
+    warnings.warn(ConvergenceWarning(message, solver, iterations, error, reason),
+                  stacklevel=stacklevel)
+
+
+class Tracer:
+    """
+    Callback that records iterations, counts evaluations and times a solve.
+
+        tracer = Tracer()
+        bisection(tracer.wrap(f), 0, 1, callback=tracer)
+        tracer.nfev, tracer.iterations, tracer.elapsed, tracer.history
+
+    Args:
+        keep_history: Store every iteration state (with 'time' and 'nfev').
+        logger: Optional logging.Logger that receives one record per iteration.
+        level: Logging level for those records.
+    """
+
+    def __init__(self, keep_history=True, logger=None, level=logging.DEBUG):
+        self.keep_history = keep_history
+        self.logger = logger
+        self.level = level
+        self.reset()
+
+    def reset(self):
+        """Clears the history and counters and restarts the timer."""
+        self.history = []
+        self.nfev = 0
+        self.iterations = 0
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        """Seconds since the tracer was created or reset."""
+        return time.perf_counter() - self.start
+
+    def wrap(self, func):
+        """Returns func with every call counted in self.nfev."""
+        def counted(*args, **kwargs):
+            self.nfev += 1
+            return func(*args, **kwargs)
+        return counted
+
+    def __call__(self, state):
+        self.iterations += 1
+        if self.keep_history:
+            record = dict(state, time=self.elapsed, nfev=self.nfev)
+            if isinstance(record.get('x'), np.ndarray):
+                record['x'] = record['x'].copy()   # solvers update x in place
+            self.history.append(record)
+        if self.logger is not None and self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s iteration %d: x = %s, error = %.3e",
+                            state['solver'], state['iteration'], state['x'], state['error'])
+
+
+if __name__ == "__main__":
+    import timeit
+    from anmx.root_finding.bisection_method import bisection
+    from anmx.linear_systems.gauss_seidel import gauss_seidel
+    from anmx.optimization.golden_section_search import golden_section_search
+    # The solvers raise the classes of the imported module, not of __main__
+    from anmx.common.instrumentation import ConvergenceWarning, Tracer
+
+    def f(x):
+        return x**3 - x - 1
+
+    # Trace a solve: iterations, evaluations and timing
+    tracer = Tracer()
+    root, _, ea, it = bisection(tracer.wrap(f), 1, 2, es=1e-10, callback=tracer)
+    print("Instrumented Bisection")
+    print("----------------------")
+    print(f"Root: {root:.10f} after {tracer.iterations} iterations, "
+          f"{tracer.nfev} evaluations, {1e3 * tracer.elapsed:.3f} ms")
+    for state in tracer.history[:3]:
+        print(f"  iteration {state['iteration']}: bracket [{state['xl']:.4f}, {state['xu']:.4f}], "
+              f"error {state['error']:.2e}, nfev {state['nfev']}")
+    print()
+
+    # Non-convergence as a structured warning, or as an exception
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', ConvergenceWarning)
+        golden_section_search(lambda x: (x - 1.0)**2, 0, 4, tol=1e-12, max_iter=10)
+    w = caught[0].message
+    print(f"Warning caught: {w} (solver={w.solver}, iterations={w.iterations}, reason={w.reason})")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', ConvergenceWarning)
+        try:
+            bisection(f, 1, 2, es=1e-14, maxit=5)
+        except ConvergenceWarning as exc:
+            print(f"Raised as exception: {exc}")
+    print()
+
+    # Overhead of the hooks in a hot loop
+    n = 200
+    A = np.diag(np.full(n, 4.0)) + np.diag(np.full(n - 1, -1.0), 1) + np.diag(np.full(n - 1, -1.0), -1)
+    b = np.ones(n)
+    t_off = min(timeit.repeat(lambda: gauss_seidel(A, b, tol=1e-10), number=5, repeat=5))
+    t_on = min(timeit.repeat(lambda: gauss_seidel(A, b, tol=1e-10, callback=Tracer(keep_history=False)),
+                             number=5, repeat=5))
+    print(f"Gauss-Seidel (n = {n}): {1e3 * t_off / 5:.2f} ms without hooks, "
+          f"{1e3 * t_on / 5:.2f} ms with a Tracer")
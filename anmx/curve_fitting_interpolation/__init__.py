@@ -0,0 +1 @@
+"""Curve fitting and interpolation: least squares, Lagrange and cubic splines."""
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.interpolate import CubicSpline
 
 def generate_cubic_spline(x_points, y_points):
     """
@@ -12,6 +11,9 @@ def generate_cubic_spline(x_points, y_points):
     Returns:
         A callable function cs(x) that calculates interpolated values.
     """
+    # Imported here so that importing this module does not load SciPy
+    from scipy.interpolate import CubicSpline
+
     # bc_type='natural' means the second derivative is zero at the endpoints.
     # This is a common engineering assumption.
     cs = CubicSpline(x_points, y_points, bc_type='natural')
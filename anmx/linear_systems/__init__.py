@@ -0,0 +1 @@
+"""Linear systems: Gauss elimination, LU decomposition and Gauss-Seidel."""
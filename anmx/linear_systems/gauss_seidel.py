@@ -12,8 +12,9 @@ until convergence within a specified tolerance.
 """
 
 import numpy as np
+from anmx.common.instrumentation import warn_not_converged
 
-def gauss_seidel(A, b, x0=None, tol=1e-6, maxit=100):
+def gauss_seidel(A, b, x0=None, tol=1e-6, maxit=100, callback=None):
     """
     Solve A·x = b using the Gauss-Seidel iterative method.
 
@@ -29,6 +30,10 @@ def gauss_seidel(A, b, x0=None, tol=1e-6, maxit=100):
         Convergence tolerance
     maxit : int
         Maximum number of iterations
+    callback : callable, optional
+        Called as callback(state) after every sweep; state has 'solver',
+        'iteration', 'x' and 'error' (the max-norm change of x).
+        x is updated in place, copy it to keep it.
 
     Returns
     -------
@@ -46,8 +51,13 @@ def gauss_seidel(A, b, x0=None, tol=1e-6, maxit=100):
             sigma = np.dot(A[i, :i], x[:i]) + np.dot(A[i, i+1:], x_old[i+1:])
             x[i] = (b[i] - sigma) / A[i, i]
 
-        if np.linalg.norm(x - x_old, np.inf) < tol:
+        dx = np.linalg.norm(x - x_old, np.inf)
+        if callback is not None:
+            callback({'solver': 'gauss_seidel', 'iteration': iteration + 1, 'x': x, 'error': dx})
+        if dx < tol:
             break
+    else:
+        warn_not_converged('gauss_seidel', maxit, dx)
     return x
 
 
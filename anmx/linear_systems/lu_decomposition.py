@@ -12,7 +12,7 @@ then solves A·x = b by forward and backward substitution.
 
 import numpy as np
 
-def lu_decomposition(A):
+def lu_decomposition(A, pivot=False):
     """
     Perform LU decomposition using Doolittle’s method.
 
@@ -20,13 +20,34 @@ def lu_decomposition(A):
     ----------
     A : ndarray
         Square matrix (n x n)
+    pivot : bool, optional
+        Use partial pivoting (row exchanges), so that matrices with a zero
+        or small pivot can be factored (default: False)
 
     Returns
     -------
     L, U : tuple of ndarray
         Lower and Upper triangular matrices
+    L, U, perm : tuple of ndarray
+        With pivot=True, also the row order perm such that A[perm] = L·U
     """
     n = A.shape[0]
+
+    if pivot:
+        U = A.astype(float)
+        L = np.eye(n)
+        perm = np.arange(n)
+        for k in range(n - 1):
+            # Partial pivoting: bring the largest remaining entry to the diagonal
+            p = np.argmax(np.abs(U[k:, k])) + k
+            if p != k:
+                U[[k, p]] = U[[p, k]]
+                L[[k, p], :k] = L[[p, k], :k]
+                perm[[k, p]] = perm[[p, k]]
+            L[k+1:, k] = U[k+1:, k] / U[k, k]
+            U[k+1:, k:] -= np.outer(L[k+1:, k], U[k, k:])
+        return L, np.triu(U), perm
+
     L = np.eye(n)
     U = np.zeros((n, n))
 
@@ -38,8 +59,11 @@ def lu_decomposition(A):
     return L, U
 
 
-def lu_solve(L, U, b):
-    """Solve A·x = b using LU factors."""
+def lu_solve(L, U, b, perm=None):
+    """Solve A·x = b using LU factors (and the row order from pivoting, if any)."""
+    b = np.asarray(b, dtype=float)
+    if perm is not None:
+        b = b[perm]
     # Forward substitution
     y = np.zeros_like(b)
     for i in range(len(b)):
@@ -0,0 +1 @@
+"""Numerical integration: Newton-Cotes, Romberg, Gauss-Legendre/Kronrod and adaptive quadrature."""
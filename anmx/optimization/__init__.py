@@ -0,0 +1 @@
+"""One-dimensional optimization: golden-section search and parabolic interpolation."""
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+from anmx.optimization.golden_section_search import golden_section_search
+from anmx.optimization.parabolic_interpolation import parabolic_interpolation
+
+# define a cost function 
+# (Example: designing a container to minimize material for a specific volume)
+def cost_function(x):
+    """
+    Example function: f(x) = (x^2)/10 - 2*sin(x)
+    This has a global minimum around x = 1.42
+    """
+    return (x**2)/10 - 2*np.sin(x)
+
+# setup parameters
+x_start, x_mid, x_end = 0, 1, 4 # initial bracket
+
+
+def scipy_reference(func, x_start, x_end):
+    """
+    Minimizes func on [x_start, x_end] with SciPy (the "Gold Standard").
+
+    SciPy is imported here, not at module level, so importing this module
+    stays cheap.
+    """
+    from scipy import optimize
+
+    # We use 'minimize_scalar' which automatically selects the best method (usually Brent's)
+    return optimize.minimize_scalar(func, bounds=(x_start, x_end), method='bounded')
+
+
+def plot_comparison(gs_x, gs_val, sp_result, path=None, show=True):
+    """Plots the cost function with the minima found (matplotlib imported lazily)."""
+    import matplotlib.pyplot as plt
+
+    # visualization confirmation
+    x_vals = np.linspace(0, 4, 100)
+    y_vals = cost_function(x_vals)
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(x_vals, y_vals, 'k-', label='Cost Function')
+    plt.plot(gs_x, gs_val, 'bo', label='Golden Section Found')
+    plt.plot(sp_result.x, sp_result.fun, 'rx', markersize=12, label='SciPy Found')
+    plt.title('Optimization Methods Comparison')
+    plt.legend()
+    plt.grid(True)
+    if path is None:
+        # keep the figure next to this module, whatever the working directory
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'optimization_comparison.png')
+    plt.savefig(path)
+    if show:
+        plt.show()
+
+
+if __name__ == "__main__":
+    # run implementations
+    # --- Golden Section ---
+    gs_x, gs_val, gs_iter = golden_section_search(cost_function, x_start, x_end)
+
+    # --- Parabolic Interpolation ---
+    pi_x, pi_val, pi_iter = parabolic_interpolation(cost_function, x_start, x_mid, x_end)
+
+    # --- SciPy implementation (The "Gold Standard") ---
+    sp_result = scipy_reference(cost_function, x_start, x_end)
+
+    # the comparison table
+    print(f"{'METHOD':<25} | {'MINIMUM X':<12} | {'ITERATIONS':<10} | {'ERROR vs SCIPY'}")
+    print("-" * 70)
+
+    print(f"{'Golden Section':<25} | {gs_x:.8f}   | {gs_iter:<10} | {abs(gs_x - sp_result.x):.2e}")
+    print(f"{'Parabolic Interpolation':<25} | {pi_x:.8f}   | {pi_iter:<10} | {abs(pi_x - sp_result.x):.2e}")
+    print(f"{'SciPy (Brent)':<25} | {sp_result.x:.8f}   | {sp_result.nfev:<10} | 0.00 (Baseline)")
+
+    plot_comparison(gs_x, gs_val, sp_result)
@@ -1,6 +1,7 @@
 import math
+from anmx.common.instrumentation import warn_not_converged
 
-def golden_section_search(func, xl, xu, tol=1e-5, max_iter=50):
+def golden_section_search(func, xl, xu, tol=1e-5, max_iter=50, callback=None):
     """
     Finds the minimum of a function using Golden Section Search.
     
@@ -10,6 +11,10 @@ def golden_section_search(func, xl, xu, tol=1e-5, max_iter=50):
         xu: Upper bound of the bracket.
         tol: Tolerance for stopping criterion.
         max_iter: Maximum number of iterations.
+        callback: Optional callback(state), called after every iteration with
+                  'solver', 'iteration', 'x' (the better interior point),
+                  'error' (the bracket width), 'fx', 'xl' and 'xu'
+                  (see common/instrumentation.py).
         
     Returns:
         (x_opt, f_opt, iterations): The optimal x, minimum value, and iter count.
@@ -49,6 +54,11 @@ def golden_section_search(func, xl, xu, tol=1e-5, max_iter=50):
             d = phi * (xu - xl)
             x2 = xu - d
             f2 = func(x2)
+
+        if callback is not None:
+            x_best, f_best = (x1, f1) if f1 < f2 else (x2, f2)
+            callback({'solver': 'golden_section_search', 'iteration': i + 1, 'x': x_best,
+                      'error': xu - xl, 'fx': f_best, 'xl': xl, 'xu': xu})
             
-    print("Warning: Maximum iterations reached.")
+    warn_not_converged('golden_section_search', max_iter, xu - xl)
     return (xu + xl) / 2, func((xu + xl) / 2), max_iter
\ No newline at end of file
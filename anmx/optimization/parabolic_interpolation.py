@@ -1,9 +1,14 @@
 import numpy as np
+from anmx.common.instrumentation import warn_not_converged
 
-def parabolic_interpolation(func, x1, x2, x3, tol=1e-5, max_iter=50):
+def parabolic_interpolation(func, x1, x2, x3, tol=1e-5, max_iter=50, callback=None):
     """
     Finds the minimum using Successive Parabolic Interpolation.
     Requires three initial points: x1 < x2 < x3.
+
+    An optional callback(state) is called after every iteration with
+    'solver', 'iteration', 'x' (the new vertex), 'error' (its distance to
+    the previous middle point) and 'fx' (see common/instrumentation.py).
     """
     f1, f2, f3 = func(x1), func(x2), func(x3)
     
@@ -14,11 +19,16 @@ def parabolic_interpolation(func, x1, x2, x3, tol=1e-5, max_iter=50):
         denominator = (x2 - x1) * (f2 - f3) - (x2 - x3) * (f2 - f1)
         
         if denominator == 0:
-            print("Error: Division by zero (collinear points).")
+            warn_not_converged('parabolic_interpolation', i, reason='degenerate',
+                               message="parabolic_interpolation: collinear points, "
+                                       "the parabola has no vertex")
             return x2, f2, i
             
         x4 = x2 - 0.5 * (numerator / denominator)
         f4 = func(x4)
+        if callback is not None:
+            callback({'solver': 'parabolic_interpolation', 'iteration': i + 1, 'x': x4,
+                      'error': abs(x4 - x2), 'fx': f4})
         
         # Check convergence
         if abs(x4 - x2) < tol:
@@ -34,5 +44,5 @@ def parabolic_interpolation(func, x1, x2, x3, tol=1e-5, max_iter=50):
             x3, x2 = x2, x4
             f3, f2 = f2, f4
             
-    print("Warning: Maximum iterations reached.")
+    warn_not_converged('parabolic_interpolation', max_iter, abs(x4 - x2))
     return x2, f2, max_iter
\ No newline at end of file
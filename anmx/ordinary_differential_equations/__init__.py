@@ -0,0 +1 @@
+"""Ordinary differential equations: explicit, adaptive, implicit and shooting solvers."""
@@ -0,0 +1,317 @@
+import argparse
+import os
+import numpy as np
+from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+from anmx.ordinary_differential_equations.events import event
+
+# Define the Physics
+def bungee_jumper_ode(t, state):
+    """
+    Computes derivatives [dx/dt, dv/dt] for a bungee jumper.
+    State vector: [position (x), velocity (v)]
+    Coordinate system: Down is Positive (x=0 at bridge)
+    """
+    x, v = state
+    
+    # Constants
+    g = 9.81        # Gravity (m/s^2)
+    m = 68.1        # Mass of jumper (kg)
+    cd = 0.25       # Drag coefficient (kg/m)
+    k = 40.0        # Spring constant of cord (N/m)
+    L = 30.0        # Length of unstretched cord (m)
+    
+    # Derivative of position is velocity
+    dxdt = v
+    
+    # Derivative of velocity is Acceleration (F/m)
+    # Forces: Gravity (down/positive), Drag (opposes v), Spring (up/negative)
+    
+    # Drag Force: Always opposes motion direction
+    # F_drag = -sign(v) * cd * v^2
+    f_drag = -np.sign(v) * cd * (v**2)
+    
+    # Spring Force: Only acts if stretched (x > L)
+    if x > L:
+        f_spring = -k * (x - L)
+    else:
+        f_spring = 0.0 # Cord is slack
+        
+    # Total Acceleration = (F_grav + F_drag + F_spring) / m
+    dvdt = g + (f_drag + f_spring) / m
+    
+    return np.array([dxdt, dvdt])
+
+# Events: points where the motion changes character
+@event(direction=1)
+def cord_taut(t, state):
+    """Fires when the jumper passes x = L and the cord starts to stretch."""
+    return state[0] - 30.0  # L = 30
+
+@event(direction=-1)
+def max_fall(t, state):
+    """Fires when the velocity turns from downward to upward (lowest point)."""
+    return state[1]
+
+# Run the Simulation
+def simulate(t_span=(0, 50), h=0.1):
+    """
+    Integrates the jump from rest at the bridge with RK4.
+
+    Steps that cross an event are split there, so the switch in force law
+    falls exactly on a step boundary.
+
+    Returns:
+        t_data, y_data, t_events, y_events (see rk4_method)
+    """
+    y0 = [0.0, 0.0]  # x=0 (at bridge), v=0 (at rest)
+    return rk4_method(bungee_jumper_ode, y0, t_span, h, events=[cord_taut, max_fall])
+
+
+def frame_indices(t_data, fps=20, speed=1.0):
+    """
+    Picks the solution rows shown as animation frames.
+
+    One frame is shown every speed/fps simulated seconds, so the frame
+    count depends on the simulated time, not on the step size.
+
+    Args:
+        t_data: Solution times (increasing).
+        fps: Frames per second of the animation.
+        speed: Simulated seconds per second of animation.
+
+    Returns:
+        Increasing array of row indices; the last row is always included.
+    """
+    t_frames = np.arange(t_data[0], t_data[-1], speed / fps)
+    indices = np.searchsorted(t_data, t_frames)
+    return np.unique(np.append(indices, len(t_data) - 1))
+
+
+def frame_durations(t_data, frames, fps=20, speed=1.0):
+    """
+    Display time of each frame in milliseconds, following the simulated time.
+
+    frame_indices drops repeated rows when fps exceeds the sampling rate of
+    the solution (fps > speed/h), so frames are not always speed/fps apart.
+    Each frame is shown until the simulated time of the next one, so the
+    animation always lasts (t_end - t_start)/speed seconds. Durations are
+    multiples of 10 ms (the GIF time unit), rounded from the cumulative
+    time so rounding errors do not add up. The last frame is shown 1/fps.
+    """
+    t_show = np.round((t_data[frames] - t_data[frames[0]]) / speed * 100) * 10
+    return np.append(np.diff(t_show), 10 * max(1, round(100 / fps))).astype(int)
+
+
+# The "Wow" Animation
+def setup_figure(t_data, position, dpi=100, figure=None):
+    """
+    Builds the two-panel figure: jumper view (left) and position trace (right).
+
+    Returns:
+        fig, artists where artists is a dict of the cord, jumper and trace lines.
+    """
+    if figure is None:
+        # matplotlib is only loaded once a figure is actually drawn
+        from matplotlib.figure import Figure
+        figure = Figure(figsize=(10, 6), dpi=dpi)
+    fig = figure
+    ax1, ax2 = fig.subplots(1, 2, gridspec_kw={'width_ratios': [1, 2]})
+
+    # Left Plot: Visual representation of jumper
+    ax1.set_xlim(-1, 1)
+    ax1.set_ylim(max(position) + 10, -5) # Inverted Y-axis so "down" is down
+    ax1.set_title("Jumper View")
+    ax1.set_ylabel("Distance Fallen (m)")
+    ax1.axhline(0, color='black', linewidth=4, label='Bridge')
+    cord_line, = ax1.plot([], [], 'k-', lw=2, animated=True) # The bungee cord
+    jumper_dot, = ax1.plot([], [], 'ro', markersize=10, animated=True) # The person
+
+    # Right Plot: The Data Trace
+    ax2.set_xlim(t_data[0], t_data[-1])
+    ax2.set_ylim(min(position)-10, max(position)+10)
+    ax2.set_title("Position vs. Time")
+    ax2.set_xlabel("Time (s)")
+    ax2.set_ylabel("Position (m)")
+    trace_line, = ax2.plot([], [], 'b-', lw=1.5, animated=True) # The path drawn so far
+
+    fig.tight_layout()
+    return fig, {'cord': cord_line, 'jumper': jumper_dot, 'trace': trace_line}
+
+
+def _draw_jumper(artists, curr_x):
+    """Moves the jumper and cord to position curr_x."""
+    artists['jumper'].set_data([0], [curr_x])
+    artists['cord'].set_data([0, 0], [0, curr_x]) # Line from bridge (0) to jumper
+    # Change cord color if stretched (visual feedback)
+    artists['cord'].set_color('red' if curr_x > 30 else 'black') # L = 30
+
+
+def render_frames(t_data, position, fps=20, speed=1.0, dpi=100, frames=None):
+    """
+    Renders the animation off screen (Agg) and yields each frame as an image.
+
+    frames are the solution rows to show (default: frame_indices(t_data, fps, speed)).
+
+    The trace is drawn incrementally: every frame only draws the solution
+    rows added since the previous frame on top of a saved background that
+    already holds the earlier trace. The work per frame therefore does not
+    grow with the length of the trace, and the total cost is linear in
+    the number of solution rows plus the number of frames.
+
+    Yields:
+        PIL RGB images, one per frame.
+    """
+    from PIL import Image
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig, artists = setup_figure(t_data, position, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    trace = artists['trace']
+    ax_trace, ax_jumper = trace.axes, artists['jumper'].axes
+    if frames is None:
+        frames = frame_indices(t_data, fps, speed)
+    start = 0
+    for frame in frames:
+        # Add the new piece of the trace (overlapping the last point) to the background
+        canvas.restore_region(background)
+        trace.set_data(t_data[start:frame + 1], position[start:frame + 1])
+        ax_trace.draw_artist(trace)
+        background = canvas.copy_from_bbox(fig.bbox)
+        start = frame
+
+        _draw_jumper(artists, position[frame])
+        ax_jumper.draw_artist(artists['cord'])
+        ax_jumper.draw_artist(artists['jumper'])
+
+        yield Image.frombuffer('RGBA', canvas.get_width_height(),
+                               canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).convert('RGB')
+
+
+def render_offline(t_data, position, path, fps=20, speed=1.0, dpi=100, optimize=False):
+    """
+    Writes the animation to a GIF file or a directory of PNG frames.
+
+    Needs no display. A path ending in '.gif' produces one animated GIF
+    (all frames share one 64-color palette, and each frame is shown for
+    frame_durations so playback follows the simulated time); any other
+    path is treated as a directory and receives frame_00000.png, ...
+    Both are written one frame at a time, so memory use does not grow
+    with the number of frames.
+
+    optimize=True stores only the rectangle of each GIF frame that changed
+    since the previous one, which makes the file several times smaller.
+
+    Returns:
+        Number of frames written.
+    """
+    from PIL import Image, GifImagePlugin
+
+    frames = frame_indices(t_data, fps, speed)
+
+    if not path.lower().endswith('.gif'):
+        os.makedirs(path, exist_ok=True)
+        n_frames = 0
+        for n_frames, frame in enumerate(render_frames(t_data, position, dpi=dpi, frames=frames),
+                                         start=1):
+            frame.save(os.path.join(path, f"frame_{n_frames - 1:05d}.png"),
+                       compress_level=1)
+        return n_frames
+
+    # The plot has few colors: one small palette for every frame, taken
+    # from the first frame next to the last one (which holds the full trace)
+    first, last = render_frames(t_data, position, dpi=dpi, frames=[frames[0], frames[-1]])
+    width, height = first.size
+    reference = Image.new('RGB', (2 * width, height))
+    reference.paste(first, (0, 0))
+    reference.paste(last, (width, 0))
+    palette = reference.quantize(colors=64, dither=Image.Dither.NONE)
+
+    durations = frame_durations(t_data, frames, fps, speed)
+    with open(path, 'wb') as fp:
+        for k, frame in enumerate(render_frames(t_data, position, dpi=dpi, frames=frames)):
+            frame = frame.quantize(palette=palette, dither=Image.Dither.NONE)
+            pixels, offset = np.asarray(frame), (0, 0)
+            if k == 0:
+                header, _ = GifImagePlugin.getheader(frame, info={'loop': 0})
+                fp.write(b''.join(header))
+            elif optimize:
+                # Only the bounding box of the pixels that changed (at least one pixel)
+                rows, cols = np.nonzero(pixels != previous)
+                if len(rows):
+                    offset = (int(cols.min()), int(rows.min()))
+                    frame = frame.crop(offset + (int(cols.max()) + 1, int(rows.max()) + 1))
+                else:
+                    frame = frame.crop((0, 0, 1, 1))
+            previous = pixels
+            for chunk in GifImagePlugin.getdata(frame, offset, duration=int(durations[k])):
+                fp.write(chunk)
+        fp.write(b';')  # GIF trailer
+    return len(frames)
+
+
+def animate(t_data, position, fps=20, speed=1.0):
+    """Shows the animation in a window (decimated to fps, incremental trace)."""
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    fig, artists = setup_figure(t_data, position, figure=plt.figure(figsize=(10, 6)))
+    frames = frame_indices(t_data, fps, speed)
+    # Trace buffers grow by the rows of each new frame instead of re-slicing
+    t_trace, x_trace = [], []
+
+    def update(k):
+        if k == 0:
+            t_trace.clear()
+            x_trace.clear()
+        t_trace.extend(t_data[len(t_trace):frames[k] + 1])
+        x_trace.extend(position[len(x_trace):frames[k] + 1])
+        artists['trace'].set_data(t_trace, x_trace)
+        _draw_jumper(artists, position[frames[k]])
+        return artists['cord'], artists['jumper'], artists['trace']
+
+    # Mean frame spacing, so playback follows the simulated time even when
+    # frame_indices had to drop repeated rows
+    interval = np.mean(frame_durations(t_data, frames, fps, speed)[:-1]) if len(frames) > 1 else 1000 / fps
+    ani = FuncAnimation(fig, update, frames=len(frames), blit=True, interval=interval)
+    plt.show()
+    return ani
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bungee jumper simulation.")
+    parser.add_argument('--output', help="Render off screen to this .gif file or "
+                                         "PNG frame directory instead of showing a window.")
+    parser.add_argument('--fps', type=float, default=20, help="Animation frames per second.")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Simulated seconds per second of animation.")
+    parser.add_argument('--dpi', type=int, default=100, help="Resolution of rendered frames.")
+    parser.add_argument('--h', type=float, default=0.1, help="RK4 time step (s).")
+    parser.add_argument('--cache', nargs='?', const='', metavar='DIR',
+                        help="Reuse the results of earlier identical runs, kept in DIR "
+                             "(default: $ANMX_CACHE_DIR or ~/.cache/anmx).")
+    args = parser.parse_args()
+
+    if args.cache is not None:
+        from anmx.common.cache import ResultCache, memoize
+        simulate = memoize(simulate, cache=ResultCache(args.cache or None))
+
+    t_data, y_data, t_events, y_events = simulate(h=args.h)
+
+    print(f"Cord becomes taut at t = {t_events[0][0]:.4f} s "
+          f"(v = {y_events[0][0][1]:.3f} m/s)")
+    print(f"Maximum fall: x = {y_events[1][0][0]:.3f} m at t = {t_events[1][0]:.4f} s")
+
+    # Extract position (x) column
+    position = y_data[:, 0]
+
+    if args.output:
+        n_frames = render_offline(t_data, position, args.output,
+                                  fps=args.fps, speed=args.speed, dpi=args.dpi)
+        print(f"Simulation Complete. Wrote {n_frames} frames to {args.output}")
+    else:
+        print("Simulation Complete. Showing Animation...")
+        animate(t_data, position, fps=args.fps, speed=args.speed)
@@ -0,0 +1,285 @@
+"""
+dormand_prince.py
+--------------------------------
+Numerical Methods Implementation:
+Adaptive Runge-Kutta Method (Dormand-Prince 5(4)).
+
+Algorithm Summary:
+Each step evaluates seven stages and forms two solutions of order 5 and 4.
+Their difference estimates the local error, which is scaled by
+    sc_i = atol + rtol * max(|y_i|, |y_new_i|)
+and reduced to an RMS norm. Steps with norm <= 1 are accepted and the
+step size is adapted by a PI controller. The last stage of an accepted
+step equals the first stage of the next one (FSAL), so an accepted step
+costs only six new derivative evaluations.
+
+"""
+
+import numpy as np
+from anmx.ordinary_differential_equations.events import (event, evaluate_events, hermite_interpolant,
+                                                         crossed_events, find_events, step_to_event)
+from anmx.common.instrumentation import warn_not_converged
+
+# Butcher tableau (Dormand & Prince, 1980)
+C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+# 5th-order weights (same as the last row of A, which is what makes FSAL work)
+B = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+# Difference between the 5th- and 4th-order weights -> error estimate
+E = np.array([71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+
+# Step-size controller constants
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+ALPHA = 0.7 / 5     # PI controller exponents for an order-4 error estimate
+BETA = 0.4 / 5
+
+
+def _initial_step(dydt, t0, y0, f0, direction, rtol, atol):
+    """Estimate a starting step size (Hairer, Norsett & Wanner, II.4)."""
+    scale = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / scale)**2))
+    d1 = np.sqrt(np.mean((f0 / scale)**2))
+    if d0 < 1e-5 or d1 < 1e-5:
+        h0 = 1e-6
+    else:
+        h0 = 0.01 * d0 / d1
+
+    y1 = y0 + direction * h0 * f0
+    f1 = np.atleast_1d(dydt(t0 + direction * h0, y1))
+    d2 = np.sqrt(np.mean(((f1 - f0) / scale)**2)) / h0
+
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2))**(1 / 5)
+
+    return min(100 * h0, h1)
+
+
+def _dopri_step(dydt, t, y, f, h, K):
+    """
+    Takes one Dormand-Prince step of signed size h from (t, y), f = f(t, y).
+
+    The seven stages are written into K. Returns (y_new, err), where err
+    is the embedded local error estimate.
+    """
+    K[0] = f
+    for s in range(1, 7):
+        dy = np.tensordot(A[s], K[:s], axes=1)
+        K[s] = dydt(t + C[s] * h, y + h * dy)
+
+    y_new = y + h * np.tensordot(B, K, axes=1)
+    err = h * np.tensordot(E, K, axes=1)
+    return y_new, err
+
+
+def _error_norm(err, scale):
+    """
+    RMS of the scaled error over the state components.
+
+    For a 2-D (n_members, n_states) ensemble the worst member decides,
+    so that no trajectory is integrated less accurately than requested.
+    """
+    return np.max(np.sqrt(np.mean((err / scale)**2, axis=-1)))
+
+
+def dopri45_method(dydt, y0, t_span, rtol=1e-6, atol=1e-9, h0=None,
+                   h_max=np.inf, max_steps=100000, events=None):
+    """
+    Solves ODEs using the adaptive Dormand-Prince 5(4) Runge-Kutta Method.
+
+    Args:
+        dydt: The derivative function f(t, y). Returns dy/dt.
+              y can be a scalar or a numpy array (for systems of ODEs).
+        y0: Initial condition(s). A 2-D (n_members, n_states) array
+            integrates an ensemble with one shared step size.
+        t_span: Tuple (t_start, t_end).
+        rtol: Relative error tolerance per step.
+        atol: Absolute error tolerance per step (scalar or per component).
+        h0: Initial step size. Estimated automatically if None.
+        h_max: Largest step size the controller may take.
+        max_steps: Maximum number of attempted steps.
+        events: Optional list of event functions g(t, y) (see events.py).
+                An accepted step that crosses an event is cut back to end
+                exactly at the event, and the integration restarts there
+                with a fresh derivative evaluation.
+
+    Returns:
+        t_values, y_values, stats
+        t_values and y_values hold only the accepted steps.
+        stats is a dict with 'nfev' (derivative evaluations), 'naccept'
+        and 'nreject' (step counts).
+        With events, also t_events and y_events (one array per event).
+    """
+    t_start, t_end = t_span
+    direction = 1.0 if t_end >= t_start else -1.0
+    scalar = np.isscalar(y0)
+
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+    t = float(t_start)
+
+    f = np.atleast_1d(dydt(t, y))
+    nfev = 1
+
+    if h0 is None:
+        h = _initial_step(dydt, t, y, f, direction, rtol, atol)
+        nfev += 1
+    else:
+        h = abs(h0)
+    h = min(h, h_max, abs(t_end - t_start))
+
+    t_values = [t]
+    y_values = [y.copy()]
+    K = np.empty((7,) + y.shape)
+    err_prev = 1e-4
+    naccept = 0
+    nreject = 0
+    step_rejected = False
+
+    if events is not None:
+        if scalar:
+            # y is kept as a shape-(1,) array; the event functions get a scalar
+            # like y0, with the same terminal/direction marks
+            events = [event(lambda t, y, g=g: g(t, y[0]),
+                            terminal=getattr(g, 'terminal', False),
+                            direction=getattr(g, 'direction', 0)) for g in events]
+        t_events = [[] for _ in events]
+        y_events = [[] for _ in events]
+        g = evaluate_events(events, t, y)
+    terminated = False
+
+    for _ in range(max_steps):
+        if direction * (t_end - t) <= 0:
+            break
+
+        # Do not step past the end of the interval
+        h = min(h, abs(t_end - t))
+        h_signed = direction * h
+
+        # Evaluate the stages (K[0] is reused from the previous step)
+        y_new, err = _dopri_step(dydt, t, y, f, h_signed, K)
+        nfev += 6
+
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err_norm = _error_norm(err, scale)
+
+        if err_norm <= 1.0:
+            # Accept the step: PI control using this and the previous error
+            if err_norm == 0.0:
+                factor = MAX_FACTOR
+            else:
+                factor = SAFETY * err_norm**(-ALPHA) * err_prev**BETA
+                factor = min(MAX_FACTOR, max(MIN_FACTOR, factor))
+            # Do not grow the step right after a rejection
+            if step_rejected:
+                factor = min(1.0, factor)
+
+            t_new = t + h_signed
+            f_new = K[6].copy()     # FSAL: last stage is f(t_new, y_new)
+            err_prev = max(err_norm, 1e-4)
+            step_rejected = False
+            naccept += 1
+
+            if events is not None:
+                g_new = evaluate_events(events, t_new, y_new)
+                crossed = crossed_events(events, g, g_new)
+                if crossed:
+                    interp = hermite_interpolant(t, y, f, t_new, y_new, f_new)
+                    t_event, idx = find_events(events, crossed, g, g_new,
+                                               t, t_new, interp)[0]
+
+                    # Cut the step back so that it ends on the event (past the crossing)
+                    if t_event != t_new:
+                        n_cut = [0]
+
+                        def step_to(s):
+                            n_cut[0] += 1
+                            return _dopri_step(dydt, t, y, f, s - t, K)[0]
+
+                        t_new, y_new = step_to_event(events[idx], step_to, t_event,
+                                                     t_new, g_new[idx])
+                        f_new = np.atleast_1d(dydt(t_new, y_new))  # restart: no FSAL
+                        nfev += 6 * n_cut[0] + 1
+                    t_events[idx].append(t_new)
+                    y_events[idx].append(y_new.copy())
+
+                    g_new = evaluate_events(events, t_new, y_new)
+                    g_new[idx] = 0.0    # do not fire again at the restart
+                    terminated = getattr(events[idx], 'terminal', False)
+                g = g_new
+
+            t = t_new
+            y = y_new
+            f = f_new
+
+            t_values.append(t)
+            y_values.append(y.copy())
+            if terminated:
+                break
+        else:
+            # Reject the step and shrink it using the error alone
+            factor = max(MIN_FACTOR, SAFETY * err_norm**(-1 / 5))
+            step_rejected = True
+            nreject += 1
+
+        h = min(h * factor, h_max)
+        if t + direction * h == t:
+            raise RuntimeError(f"Step size became too small at t = {t}.")
+    else:
+        warn_not_converged('dopri45_method', max_steps, reason='maxit',
+                           message=f"dopri45_method: maximum number of steps ({max_steps}) "
+                                   f"reached at t = {t}")
+
+    t_values = np.array(t_values)
+    y_values = np.array(y_values)
+    if scalar:
+        y_values = y_values[:, 0]
+
+    stats = {'nfev': nfev, 'naccept': naccept, 'nreject': nreject}
+    if events is not None:
+        t_events = [np.array(te) for te in t_events]
+        y_events = [np.array(ye) for ye in y_events]
+        if scalar:
+            y_events = [ye.reshape(-1) for ye in y_events]
+        return t_values, y_values, stats, t_events, y_events
+    return t_values, y_values, stats
+
+
+if __name__ == "__main__":
+    from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+
+    # Test problem: damped oscillator with a known exact solution
+    # y'' + 0.2 y' + 4 y = 0,  y(0) = 1, y'(0) = 0
+    def oscillator(t, y):
+        return np.array([y[1], -0.2 * y[1] - 4.0 * y[0]])
+
+    def exact(t):
+        wd = np.sqrt(4.0 - 0.01)
+        return np.exp(-0.1 * t) * (np.cos(wd * t) + 0.1 / wd * np.sin(wd * t))
+
+    t_span = (0, 20)
+    t_dp, y_dp, stats = dopri45_method(oscillator, [1.0, 0.0], t_span, rtol=1e-7, atol=1e-9)
+    err_dp = np.max(np.abs(y_dp[:, 0] - exact(t_dp)))
+
+    # Fixed-step RK4 with a step small enough to match the accuracy
+    h = 0.02
+    t_rk, y_rk = rk4_method(oscillator, [1.0, 0.0], t_span, h)
+    err_rk = np.max(np.abs(y_rk[:, 0] - exact(t_rk)))
+    nfev_rk = 4 * (len(t_rk) - 1)
+
+    print("Dormand-Prince 5(4) vs. Fixed-Step RK4")
+    print("---------------------------------------")
+    print(f"{'METHOD':<16} | {'MAX ERROR':<10} | {'NFEV':<6} | {'STEPS'}")
+    print(f"{'Dormand-Prince':<16} | {err_dp:.2e}   | {stats['nfev']:<6} | "
+          f"{stats['naccept']} accepted, {stats['nreject']} rejected")
+    print(f"{'RK4 (h=0.02)':<16} | {err_rk:.2e}   | {nfev_rk:<6} | {len(t_rk) - 1}")
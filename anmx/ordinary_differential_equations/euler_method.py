@@ -0,0 +1,61 @@
+import numpy as np
+from anmx.ordinary_differential_equations.events import fixed_step_with_events
+
+
+def euler_step(dydt, t, y, h, slope=None):
+    """
+    Advances y(t) to y(t + h) with a single Euler step.
+    slope = f(t, y) may be passed in if the caller already has it.
+    """
+    if slope is None:
+        slope = dydt(t, y)
+    # y_new = y_old + slope * step
+    return y + slope * h
+
+
+def euler_method(dydt, y0, t_span, h, events=None):
+    """
+    Solves ODEs using Euler's Method: y_{i+1} = y_i + f(t_i, y_i) * h
+    
+    Args:
+        dydt: The derivative function f(t, y). Returns dy/dt.
+              y can be a scalar or a numpy array (for systems of ODEs).
+        y0: Initial condition(s).
+        t_span: Tuple (t_start, t_end). The last step is shortened so the
+                integration ends exactly at t_end.
+        h: Step size.
+        events: Optional list of event functions g(t, y) (see events.py).
+                Steps that cross an event are split at the event time.
+        
+    Returns:
+        t_values, y_values (numpy arrays)
+        With events, also t_events and y_events (one array per event).
+    """
+    t_start, t_end = t_span
+    
+    # Create time array
+    # Step count from the span rather than np.arange(t_start, t_end + h, h),
+    # whose length is sensitive to round-off and can add a step past t_end
+    n_steps = int(np.ceil((t_end - t_start) / h - 1e-9))
+    t_values = t_start + h * np.arange(n_steps + 1)
+    t_values[-1] = t_end
+    
+    # Initialize solution array
+    # Check if y0 is a scalar or a vector
+    if np.isscalar(y0):
+        y_values = np.zeros(len(t_values))
+    else:
+        # Vectors, or (n_members, n_states) arrays for ensembles
+        y_values = np.zeros((len(t_values),) + np.shape(y0))
+        
+    y_values[0] = y0
+
+    if events is not None:
+        return fixed_step_with_events(euler_step, dydt, t_values, y_values, events)
+    
+    for i in range(1, len(t_values)):
+        # Apply Euler's formula (the last step may be shorter than h)
+        step = h if i < n_steps else t_values[i] - t_values[i-1]
+        y_values[i] = euler_step(dydt, t_values[i-1], y_values[i-1], step)
+        
+    return t_values, y_values
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+events.py
+--------------------------------
+Numerical Methods Implementation:
+Event Detection for ODE Integrators.
+
+Algorithm Summary:
+An event is a scalar function g(t, y) whose zero marks a change in the
+model (a cord becoming taut, a velocity changing sign, ...). After each
+step the integrator evaluates g at the new state. A sign change over the
+step means an event lies inside it. The event time is then located by a
+bracketing root finder (Illinois false position) applied to
+    g(t, p(t)),
+where p(t) is a cubic Hermite interpolant of the step. No extra
+derivative evaluations are needed for the search. The integrator then
+steps to the located time with the method itself. Because p(t) is only an
+approximation, that state may not have crossed yet; in that case the
+root is refined on the method's own step map, t -> g(t, step(t0, y0, t)),
+so the reported (and restart) state always lies past the crossing.
+
+Event functions may carry two optional attributes:
+    terminal  : stop the integration at the event (default False)
+    direction : only fire on increasing (+1) or decreasing (-1)
+                crossings, or on both (0, the default)
+
+"""
+
+import numpy as np
+
+
+def event(func=None, terminal=False, direction=0):
+    """
+    Marks a function g(t, y) as an event with the given attributes.
+
+    Can be used as a plain call, event(g, terminal=True), or as a
+    decorator, @event(direction=-1).
+    """
+    def mark(g):
+        g.terminal = terminal
+        g.direction = direction
+        return g
+
+    if func is None:
+        return mark
+    return mark(func)
+
+
+def evaluate_events(events, t, y):
+    """Evaluates every event function at (t, y)."""
+    return np.array([float(g(t, y)) for g in events])
+
+
+def hermite_interpolant(t0, y0, f0, t1, y1, f1):
+    """
+    Cubic Hermite interpolant between two states with known derivatives.
+
+    Returns:
+        A callable p(t) with p(t0) = y0, p(t1) = y1, p'(t0) = f0, p'(t1) = f1.
+    """
+    h = t1 - t0
+
+    def p(t):
+        s = (t - t0) / h
+        h00 = (1 + 2*s) * (1 - s)**2
+        h10 = s * (1 - s)**2
+        h01 = s**2 * (3 - 2*s)
+        h11 = s**2 * (s - 1)
+        return h00*y0 + h10*h*f0 + h01*y1 + h11*h*f1
+
+    return p
+
+
+def _crossed(g_old, g_new, direction):
+    """True if g changed sign (in the requested direction) over a step."""
+    up = g_old < 0 <= g_new
+    down = g_old > 0 >= g_new
+    if direction > 0:
+        return up
+    if direction < 0:
+        return down
+    return up or down
+
+
+def locate_root(g, ta, tb, ga, gb, xtol=None, maxit=100):
+    """
+    Finds a zero of g in [ta, tb] with the Illinois false-position method.
+
+    Args:
+        g: Scalar function of t.
+        ta, tb: Bracket with g(ta) and g(tb) of opposite sign (or gb == 0).
+        ga, gb: g(ta) and g(tb).
+        xtol: Width at which the bracket is considered converged.
+        maxit: Maximum number of iterations.
+
+    Returns:
+        The end of the final bracket that lies on the far side of the zero,
+        so that the event is never reported before it actually happens.
+    """
+    if xtol is None:
+        xtol = 4 * np.finfo(float).eps * max(abs(ta), abs(tb), 1.0)
+
+    # tb starts on the far side of the zero; the ends swap during the search
+    far_sign = np.sign(gb)
+    side = 0
+    for _ in range(maxit):
+        if abs(tb - ta) <= xtol or gb == 0:
+            break
+        tr = (ta * gb - tb * ga) / (gb - ga)
+        # Keep the trial point strictly inside the bracket
+        tr = min(max(tr, min(ta, tb) + xtol / 2), max(ta, tb) - xtol / 2)
+        gr = g(tr)
+
+        if gr * gb < 0:
+            ta, ga = tb, gb
+            tb, gb = tr, gr
+            side = 0
+        else:
+            tb, gb = tr, gr
+            # Illinois modification: halve the stale end point's weight
+            if side == 1:
+                ga *= 0.5
+            side = 1
+
+    if gb != 0 and np.sign(gb) != far_sign:
+        return ta
+    return tb
+
+
+def crossed_events(events, g_old, g_new):
+    """Returns the indices of the events whose sign changed over a step."""
+    return [i for i, g in enumerate(events)
+            if _crossed(g_old[i], g_new[i], getattr(g, 'direction', 0))]
+
+
+def find_events(events, indices, g_old, g_new, t0, t1, interp):
+    """
+    Locates the given events inside the step (t0, t1].
+
+    Args:
+        events: List of event functions g(t, y).
+        indices: Indices of the events that changed sign over the step.
+        g_old, g_new: Event values at the start and end of the step.
+        t0, t1: Step end points.
+        interp: Callable p(t) approximating y inside the step.
+
+    Returns:
+        List of (t_event, index) tuples, earliest first.
+    """
+    found = []
+    for i in indices:
+        g = events[i]
+        t_event = locate_root(lambda t: g(t, interp(t)), t0, t1, g_old[i], g_new[i])
+        found.append((t_event, i))
+
+    found.sort(key=lambda item: (item[0] - t0) / (t1 - t0))
+    return found
+
+
+def step_to_event(g, step_to, t_event, t1, g_end):
+    """
+    Integrates to an event time and makes sure the state is past the crossing.
+
+    Args:
+        g: The event function g(t, y).
+        step_to: Callable t -> y that integrates with the actual method from
+                 the start of the step to t.
+        t_event: Event time located on the interpolant.
+        t1: End of the step; g(t1, step_to(t1)) = g_end is past the crossing.
+        g_end: Event value at the end of the step.
+
+    Returns:
+        (t, y) with g(t, y) zero or of the same sign as g_end.
+    """
+    y = step_to(t_event)
+    g_event = g(t_event, y)
+    if g_event == 0 or np.sign(g_event) == np.sign(g_end):
+        return t_event, y
+    # The interpolant placed the zero too early: bracket [t_event, t1] on
+    # the real step map; locate_root returns its end on the far side
+    t = locate_root(lambda s: g(s, step_to(s)), t_event, t1, g_event, g_end)
+    return t, step_to(t)
+
+
+def fixed_step_with_events(step, dydt, t_values, y_values, events):
+    """
+    Runs a one-step method over a fixed time grid with event detection.
+
+    When an event is found inside a step, the step is split: the method
+    first integrates exactly to the event time, so the discontinuity falls
+    on a step boundary, and then restarts from the event state to finish
+    the original step. The output grid is therefore left unchanged unless
+    a terminal event stops the integration early.
+
+    Args:
+        step: One-step method step(dydt, t, y, h) -> y_new.
+        dydt: The derivative function f(t, y).
+        t_values: Time grid (t_values[0] is the initial time).
+        y_values: Solution array with y_values[0] set; filled in place.
+        events: List of event functions g(t, y).
+
+    Returns:
+        t_values, y_values, t_events, y_events
+        t_events and y_events hold one array per event function.
+    """
+    t_events = [[] for _ in events]
+    y_events = [[] for _ in events]
+
+    g = evaluate_events(events, t_values[0], y_values[0])
+
+    for i in range(1, len(t_values)):
+        t = t_values[i-1]
+        y = y_values[i-1]
+        t_target = t_values[i]
+        terminated = False
+
+        while True:
+            h = t_target - t
+            y_new = step(dydt, t, y, h)
+            g_new = evaluate_events(events, t_target, y_new)
+
+            crossed = crossed_events(events, g, g_new)
+            if not crossed:
+                break
+
+            # Only now pay for the end-point slopes needed by the interpolant
+            interp = hermite_interpolant(t, y, dydt(t, y), t_target, y_new,
+                                         dydt(t_target, y_new))
+            t_event, idx = find_events(events, crossed, g, g_new, t, t_target, interp)[0]
+
+            # Integrate exactly to the event (past the crossing) and restart from there
+            t_event, y_event = step_to_event(events[idx],
+                                             lambda s, t=t, y=y: step(dydt, t, y, s - t),
+                                             t_event, t_target, g_new[idx])
+            t_events[idx].append(t_event)
+            y_events[idx].append(np.copy(y_event))
+
+            g = evaluate_events(events, t_event, y_event)
+            g[idx] = 0.0    # already handled; do not fire again at the restart
+            t, y = t_event, y_event
+
+            if getattr(events[idx], 'terminal', False):
+                terminated = True
+                break
+            if t == t_target:
+                y_new = y_event
+                g_new = g
+                break
+
+        if terminated:
+            t_values = np.append(t_values[:i], t)
+            y_values = np.concatenate([y_values[:i], [y]])
+            break
+
+        y_values[i] = y_new
+        g = g_new
+
+    t_events = [np.array(te) for te in t_events]
+    y_events = [np.array(ye) for ye in y_events]
+    return t_values, y_values, t_events, y_events
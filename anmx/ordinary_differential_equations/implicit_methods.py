@@ -0,0 +1,278 @@
+"""
+implicit_methods.py
+--------------------------------
+Numerical Methods Implementation:
+Implicit ODE Solvers for Stiff Problems (Backward Euler, Trapezoidal, BDF).
+
+Algorithm Summary:
+Every method here can be written as
+    y_new = rhs + h * beta * f(t_new, y_new),
+where rhs and beta depend on the method:
+    backward Euler : rhs = y_n,                        beta = 1
+    trapezoidal    : rhs = y_n + h/2 * f(t_n, y_n),    beta = 1/2
+    BDF order k    : rhs = sum_j a_j * y_(n+1-j),      beta = b_k
+The implicit equation is solved by Newton's method with the iteration matrix
+    M = I - h * beta * J,    J = df/dy,
+factored once by LU decomposition with partial pivoting (linear_systems/lu_decomposition.py).
+J and the LU factors are reused across Newton iterations and across steps
+(simplified Newton). They are only refreshed when convergence becomes slow
+or fails, so most steps cost a few derivative evaluations and triangular
+solves instead of a new Jacobian and factorization.
+
+Because the methods are stable for stiff problems, the step size is set
+by accuracy rather than by the fastest decaying mode.
+
+Stability of the BDF orders: BDF1 (backward Euler) and BDF2 are A-stable,
+so every decaying or oscillating mode stays bounded for any h. BDF3-5 are
+only stable in a sector around the negative real axis; modes close to the
+imaginary axis (stiff springs, lightly damped oscillations) can grow for
+larger h. The BDF order is therefore capped at 2 by default; raise
+max_order only for problems whose stiff modes are strongly damped.
+
+"""
+
+import numpy as np
+from anmx.linear_systems.lu_decomposition import lu_decomposition, lu_solve
+
+# BDF coefficients: y_(n+1) = sum_j A_j * y_(n+1-j) + h * B * f_(n+1)
+BDF_A = {
+    1: [1.0],
+    2: [4/3, -1/3],
+    3: [18/11, -9/11, 2/11],
+    4: [48/25, -36/25, 16/25, -3/25],
+    5: [300/137, -300/137, 200/137, -75/137, 12/137],
+}
+BDF_B = {1: 1.0, 2: 2/3, 3: 6/11, 4: 12/25, 5: 60/137}
+
+METHODS = ('backward_euler', 'trapezoidal', 'bdf')
+
+
+def finite_difference_jacobian(dydt, t, y, f0=None):
+    """
+    Approximates J = df/dy by forward differences, one column at a time.
+
+    Args:
+        dydt: The derivative function f(t, y).
+        t, y: Point at which to evaluate the Jacobian.
+        f0: f(t, y), if already known.
+
+    Returns:
+        (J, nfev): Jacobian (n x n) and the number of f evaluations used.
+    """
+    nfev = 0
+    if f0 is None:
+        f0 = np.asarray(dydt(t, y), dtype=float)
+        nfev += 1
+
+    n = len(y)
+    J = np.empty((n, n))
+    eps = np.sqrt(np.finfo(float).eps)
+    for j in range(n):
+        dy = eps * max(1.0, abs(y[j]))
+        y_pert = y.copy()
+        y_pert[j] += dy
+        J[:, j] = (np.asarray(dydt(t, y_pert), dtype=float) - f0) / dy
+    nfev += n
+    return J, nfev
+
+
+def implicit_method(dydt, y0, t_span, h, method='bdf', max_order=2, jac=None,
+                    newton_tol=1e-10, max_newton=8):
+    """
+    Solves (stiff) ODEs with an implicit method and simplified Newton iterations.
+
+    Args:
+        dydt: The derivative function f(t, y). Returns dy/dt.
+              y can be a scalar or a numpy array (for systems of ODEs).
+        y0: Initial condition(s).
+        t_span: Tuple (t_start, t_end).
+        h: Step size. The BDF formulas assume equal steps, so if h does not
+           divide the span it is reduced to the largest step that does,
+           and the grid still ends exactly at t_end.
+        method: 'backward_euler', 'trapezoidal' or 'bdf'.
+        max_order: Highest BDF order (1 to 5, default 2). BDF starts at
+                   order 1 and raises the order by one per step as past
+                   values become available. Orders above 2 are not A-stable
+                   (see the module docstring).
+        jac: Optional Jacobian function jac(t, y) -> (n x n) array.
+             Finite differences are used if None.
+        newton_tol: Newton convergence tolerance, relative to |y|.
+        max_newton: Maximum Newton iterations per attempt.
+
+    Returns:
+        t_values, y_values, stats
+        stats is a dict with 'nfev' (derivative evaluations), 'njev'
+        (Jacobians), 'nlu' (LU factorizations) and 'nnewton' (iterations).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}'. Use one of {METHODS}.")
+    if not 1 <= max_order <= 5:
+        raise ValueError("max_order must be between 1 and 5.")
+
+    t_start, t_end = t_span
+    n_steps = int(np.ceil((t_end - t_start) / h - 1e-9))
+    if n_steps > 0:
+        # Equal fitted steps (as in shooting_method._fitted_step)
+        h = (t_end - t_start) / n_steps
+    t_values = t_start + h * np.arange(n_steps + 1)
+    t_values[-1] = t_end
+
+    scalar = np.isscalar(y0)
+    y_values = np.zeros((n_steps + 1, np.size(y0)))
+    y_values[0] = y0
+    n = y_values.shape[1]
+
+    def f(t, y):
+        return np.atleast_1d(np.asarray(dydt(t, y[0] if scalar else y), dtype=float))
+
+    def jacobian(t, y, f_y):
+        if jac is None:
+            return finite_difference_jacobian(f, t, y, f_y)
+        return np.atleast_2d(np.asarray(jac(t, y[0] if scalar else y), dtype=float)), 0
+
+    stats = {'nfev': 0, 'njev': 0, 'nlu': 0, 'nnewton': 0}
+    J = None            # current Jacobian
+    LU = None           # LU factors of I - h*beta*J
+    lu_beta = None      # beta used for the current factors
+    jac_is_fresh = False
+
+    f_old = f(t_start, y_values[0])
+    stats['nfev'] += 1
+
+    for i in range(1, n_steps + 1):
+        t_new = t_values[i]
+        y_old = y_values[i-1]
+
+        # Explicit part of the method
+        if method == 'backward_euler':
+            beta = 1.0
+            rhs = y_old
+        elif method == 'trapezoidal':
+            beta = 0.5
+            rhs = y_old + 0.5 * h * f_old
+        else:
+            order = min(i, max_order)
+            beta = BDF_B[order]
+            rhs = np.zeros(n)
+            for j, a in enumerate(BDF_A[order]):
+                rhs += a * y_values[i-1-j]
+
+        # Predictor: linear extrapolation from the last two values
+        y_guess = 2 * y_old - y_values[i-2] if i > 1 else y_old.copy()
+
+        converged = False
+        n_restarts = 0
+        while not converged:
+            if J is None:
+                J, nfev = jacobian(t_new, y_guess, None)
+                stats['nfev'] += nfev
+                stats['njev'] += 1
+                jac_is_fresh = True
+                LU = None
+            if LU is None or lu_beta != beta:
+                LU = lu_decomposition(np.eye(n) - h * beta * J, pivot=True)
+                lu_beta = beta
+                stats['nlu'] += 1
+
+            # Simplified Newton: solve M dy = -G(y) with the stored factors
+            y_new = y_guess.copy()
+            dy_norm_first = None
+            rate = None
+            for k in range(max_newton):
+                f_new = f(t_new, y_new)
+                stats['nfev'] += 1
+                stats['nnewton'] += 1
+
+                residual = y_new - rhs - h * beta * f_new
+                dy = lu_solve(LU[0], LU[1], -residual, LU[2])
+                y_new += dy
+
+                dy_norm = np.linalg.norm(dy, np.inf)
+                tol = newton_tol * (1.0 + np.linalg.norm(y_new, np.inf))
+                if k == 0:
+                    dy_norm_first = dy_norm
+                else:
+                    # Mean contraction per iteration since the first update. A
+                    # single update larger than the one before is not yet
+                    # divergence; the iteration often contracts after it.
+                    rate = (dy_norm / dy_norm_first) ** (1.0 / k)
+                    if k >= 2 and rate >= 1.0:
+                        break   # diverging
+                # Converged when the update, or the estimated remaining error
+                # rate/(1 - rate) * |dy| of a contracting iteration, is small
+                if dy_norm <= tol or (rate is not None and rate < 1.0
+                                      and rate / (1.0 - rate) * dy_norm <= tol):
+                    converged = True
+                    break
+
+            if not converged:
+                if jac_is_fresh:
+                    n_restarts += 1
+                    if n_restarts > max_newton or not np.all(np.isfinite(y_new)):
+                        raise RuntimeError(f"Newton iteration failed at t = {t_new}; "
+                                           "try a smaller step size h.")
+                    # Even a fresh Jacobian was not good enough: re-evaluate
+                    # it at the current iterate and continue from there
+                    y_guess = y_new
+                # Rebuild the Jacobian (stale, or taken at the new iterate) and retry
+                J = None
+                continue
+
+            # Slow convergence: refresh the Jacobian before the next step
+            if rate is not None and rate > 0.5:
+                J = None
+            jac_is_fresh = False
+
+        y_values[i] = y_new
+        if method == 'trapezoidal':
+            f_old = f(t_new, y_new)
+            stats['nfev'] += 1
+
+    if scalar:
+        y_values = y_values[:, 0]
+    return t_values, y_values, stats
+
+
+def backward_euler_method(dydt, y0, t_span, h, **kwargs):
+    """Backward (implicit) Euler: y_(n+1) = y_n + h * f(t_(n+1), y_(n+1))."""
+    return implicit_method(dydt, y0, t_span, h, method='backward_euler', **kwargs)
+
+
+def trapezoidal_method(dydt, y0, t_span, h, **kwargs):
+    """Trapezoidal rule: y_(n+1) = y_n + h/2 * (f_n + f_(n+1))."""
+    return implicit_method(dydt, y0, t_span, h, method='trapezoidal', **kwargs)
+
+
+def bdf_method(dydt, y0, t_span, h, max_order=2, **kwargs):
+    """Backward Differentiation Formulas of order 1 up to max_order (A-stable up to 2)."""
+    return implicit_method(dydt, y0, t_span, h, method='bdf', max_order=max_order, **kwargs)
+
+
+if __name__ == "__main__":
+    from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+
+    # Stiff test problem: a fast mode relaxing onto a slow one
+    #   y1' = -1000 (y1 - cos t) - sin t     (exact: y1 = cos t)
+    #   y2' = y1 - y2
+    def stiff(t, y):
+        return np.array([-1000.0 * (y[0] - np.cos(t)) - np.sin(t), y[0] - y[1]])
+
+    y0 = [1.0, 0.0]
+    t_span = (0, 10)
+    t_ref = np.linspace(0, 10, 11)
+
+    print("Stiff Problem: Explicit vs. Implicit Methods")
+    print("---------------------------------------------")
+    print(f"{'METHOD':<16} | {'h':<6} | {'ERROR y1(10)':<12} | {'NFEV':<6} | {'NJEV':<4} | {'NLU'}")
+
+    for h in [0.01, 0.002]:
+        with np.errstate(over='ignore', invalid='ignore'):
+            t, y = rk4_method(stiff, y0, t_span, h)
+        err = abs(y[-1, 0] - np.cos(t[-1]))
+        print(f"{'RK4':<16} | {h:<6} | {err:<12.2e} | {4 * (len(t) - 1):<6} | {'-':<4} | -")
+
+    for name in METHODS:
+        t, y, stats = implicit_method(stiff, y0, t_span, 0.05, method=name)
+        err = abs(y[-1, 0] - np.cos(t[-1]))
+        print(f"{name:<16} | {0.05:<6} | {err:<12.2e} | {stats['nfev']:<6} | "
+              f"{stats['njev']:<4} | {stats['nlu']}")
@@ -0,0 +1,260 @@
+"""
+shooting_method.py
+--------------------------------
+Numerical Methods Implementation:
+Shooting Methods for Boundary Value Problems.
+
+Algorithm Summary:
+A boundary value problem fixes some conditions at x = a and some at x = b.
+The shooting method guesses the missing initial values, integrates to b
+as an initial value problem, and adjusts the guess until the conditions
+at b are met.
+
+Single shooting (one unknown s):
+  1. Integrate a whole batch of trial values s at once. The states are
+     stacked into one (n_trials, n_states) array for rk4_method.
+  2. Find where the boundary residual changes sign across the batch.
+  3. Refine s inside that bracket with a bracketing root finder.
+
+Multiple shooting (long or sensitive domains):
+  The domain is split into segments. The unknowns are the states at every
+  segment start. The equations are the boundary conditions plus continuity
+  between neighbouring segments. They are solved with Newton's method for
+  systems (root_finding/newton_systems.py). Each segment, together with its
+  finite-difference perturbations, is integrated as one batch, and
+  segments can run in separate processes.
+
+The derivative function must be vectorized over rows: dydt(x, Y) takes
+and returns (n_rows, n_states) arrays.
+
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_method
+from anmx.ordinary_differential_equations.events import locate_root
+from anmx.root_finding.newton_systems import newton_system
+
+
+def _fitted_step(x_span, h):
+    """Largest step <= h that divides the interval exactly (no overshoot at b)."""
+    length = abs(x_span[1] - x_span[0])
+    return length / max(1, int(np.ceil(length / h - 1e-9)))
+
+
+def shooting_method(dydt, x_span, initial_state, residual, s_range, h,
+                    n_trials=64, xtol=None):
+    """
+    Solves a two-point BVP with one unknown initial value by single shooting.
+
+    Args:
+        dydt: Vectorized derivative function f(x, Y), Y of shape (n_rows, n_states).
+        x_span: Tuple (a, b).
+        initial_state: Function mapping an array of trial values s to the
+                       initial states, shape (len(s), n_states).
+        residual: Function mapping the states at b, shape (n_rows, n_states),
+                  to the boundary residuals, shape (n_rows,). Zero when the
+                  boundary condition at b is satisfied.
+        s_range: Tuple (s_min, s_max) to sweep for a sign change.
+        h: Step size.
+        n_trials: Number of trial values integrated in the first sweep.
+        xtol: Absolute tolerance on s for the bracketing refinement.
+
+    Returns:
+        s, x_values, y_values
+        s is the shooting parameter of the first root found in s_range;
+        x_values, y_values is the corresponding solution.
+    """
+    h = _fitted_step(x_span, h)
+
+    def shoot(s):
+        x_values, y_values = rk4_method(dydt, initial_state(np.atleast_1d(s)), x_span, h)
+        return x_values, y_values
+
+    # Sweep: all trial values in one vectorized integration
+    s_trials = np.linspace(s_range[0], s_range[1], n_trials)
+    _, y_trials = shoot(s_trials)
+    r = residual(y_trials[-1])
+
+    changes = np.nonzero(r[:-1] * r[1:] <= 0)[0]
+    if len(changes) == 0:
+        raise ValueError("Boundary residual does not change sign in s_range. "
+                         "Choose a different s_range.")
+    k = changes[0]
+
+    if r[k] == 0:
+        s_root = s_trials[k]
+    else:
+        # Refine inside the bracket [s_k, s_(k+1)]
+        def g(s):
+            return residual(shoot(s)[1][-1])[0]
+        s_root = locate_root(g, s_trials[k], s_trials[k+1], r[k], r[k+1], xtol=xtol)
+
+    x_values, y_values = shoot(s_root)
+    return s_root, x_values, y_values[:, 0]
+
+
+def _integrate_segment(dydt, x_span, Y0, h, full=False):
+    """Integrates one segment for a batch of initial states (worker process)."""
+    x_values, y_values = rk4_method(dydt, Y0, x_span, h)
+    if full:
+        return x_values, y_values
+    return y_values[-1]
+
+
+def multiple_shooting(dydt, x_span, bc, y_guess, h, n_segments=4, n_workers=1,
+                      es=1e-10, maxit=50):
+    """
+    Solves a two-point BVP by multiple shooting.
+
+    Args:
+        dydt: Vectorized derivative function f(x, Y), Y of shape (n_rows, n_states).
+              Must be defined at module level when n_workers > 1.
+        x_span: Tuple (a, b).
+        bc: Boundary conditions bc(ya, yb) -> array of n_states residuals.
+        y_guess: Initial guess for the state, either one array of n_states
+                 values (used at every node) or a function y_guess(x).
+        h: Step size inside each segment.
+        n_segments: Number of shooting segments.
+        n_workers: Number of processes to integrate segments in parallel.
+        es: Newton stopping criterion (relative change of the unknowns).
+        maxit: Maximum Newton iterations.
+
+    Returns:
+        x_values, y_values, iterations
+    """
+    a, b = x_span
+    nodes = np.linspace(a, b, n_segments + 1)
+    spans = list(zip(nodes[:-1], nodes[1:]))
+    h = _fitted_step(spans[0], h)
+
+    if callable(y_guess):
+        Z0 = np.array([y_guess(x) for x in nodes[:-1]], dtype=float)
+    else:
+        Z0 = np.tile(np.asarray(y_guess, dtype=float), (n_segments, 1))
+    n = Z0.shape[1]
+    eye = np.eye(n)
+    eps = np.sqrt(np.finfo(float).eps)
+
+    pool = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+
+    def integrate_all(batches, full=False):
+        """Integrates every segment's batch, in parallel if a pool exists."""
+        args = [(dydt, span, batch, h, full) for span, batch in zip(spans, batches)]
+        if pool is None:
+            return [_integrate_segment(*arg) for arg in args]
+        return list(pool.map(_integrate_segment, *zip(*args)))
+
+    def residuals(Z, ends):
+        Z = Z.reshape(n_segments, n)
+        r = [np.asarray(bc(Z[0], ends[-1]), dtype=float)]
+        for k in range(n_segments - 1):
+            r.append(ends[k] - Z[k+1])     # continuity between segments
+        return np.concatenate(r)
+
+    def func(z):
+        Z = z.reshape(n_segments, n)
+        ends = [y_end[0] for y_end in integrate_all([Z[k][None, :] for k in range(n_segments)])]
+        return residuals(z, ends)
+
+    def jac(z):
+        Z = z.reshape(n_segments, n)
+        # Each batch: the node state and its n perturbations
+        steps = eps * np.maximum(1.0, np.abs(Z))
+        batches = [np.vstack([Z[k], Z[k] + np.diag(steps[k])]) for k in range(n_segments)]
+        results = integrate_all(batches)
+        ends = [res[0] for res in results]
+        Phi = [((res[1:] - res[0]) / steps[k][:, None]).T for k, res in enumerate(results)]
+
+        # Boundary condition derivatives with respect to ya and yb
+        r0 = np.asarray(bc(Z[0], ends[-1]), dtype=float)
+        Ba = np.empty((n, n))
+        Bb = np.empty((n, n))
+        for j in range(n):
+            d = eps * max(1.0, abs(Z[0][j]))
+            Ba[:, j] = (np.asarray(bc(Z[0] + d * eye[j], ends[-1])) - r0) / d
+            d = eps * max(1.0, abs(ends[-1][j]))
+            Bb[:, j] = (np.asarray(bc(Z[0], ends[-1] + d * eye[j])) - r0) / d
+
+        J = np.zeros((n * n_segments, n * n_segments))
+        J[:n, :n] += Ba
+        J[:n, -n:] += Bb @ Phi[-1]
+        for k in range(n_segments - 1):
+            rows = slice(n * (k + 1), n * (k + 2))
+            J[rows, n * k:n * (k + 1)] = Phi[k]
+            J[rows, n * (k + 1):n * (k + 2)] = -eye
+        return J
+
+    try:
+        z, _, _, iterations, _ = newton_system(func, Z0.ravel(), jac=jac, es=es, maxit=maxit)
+        Z = z.reshape(n_segments, n)
+        pieces = integrate_all([Z[k][None, :] for k in range(n_segments)], full=True)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Join the segments, dropping each duplicated interior node
+    x_values = np.concatenate([pieces[0][0]] + [x[1:] for x, _ in pieces[1:]])
+    y_values = np.concatenate([pieces[0][1][:, 0]] + [y[1:, 0] for _, y in pieces[1:]])
+    return x_values, y_values, iterations
+
+
+# Beam from root_finding/beam_deflection_bisection.py (pinned at x = 0, fixed at x = L)
+L = 400.0      # cm
+E = 52000.0    # kN/cm²
+I = 32000.0    # cm⁴
+w = 4.0        # kN/cm
+
+
+def beam_ode(x, Y):
+    """EI·y'''' = -w as a first-order system in [y, y', y'', y'''] (rows of Y)."""
+    dY = np.empty_like(Y)
+    dY[:, :3] = Y[:, 1:]
+    dY[:, 3] = -w / (E * I)
+    return dY
+
+
+def beam_bc(ya, yb):
+    """Pinned end: y(0) = y''(0) = 0. Fixed end: y(L) = y'(L) = 0."""
+    return np.array([ya[0], ya[2], yb[0], yb[1]])
+
+
+def heated_rod_ode(x, Y):
+    """Heated rod (Chapra & Clough): T'' = h'(T - Ta), h' = 0.05, Ta = 20."""
+    return np.column_stack([Y[:, 1], 0.05 * (Y[:, 0] - 20.0)])
+
+
+if __name__ == "__main__":
+    import time
+
+    # --- Single shooting: heated rod, T(0) = 40, T(10) = 200, unknown T'(0) ---
+    s, x, T = shooting_method(
+        heated_rod_ode, (0, 10),
+        initial_state=lambda s: np.column_stack([np.full(len(s), 40.0), s]),
+        residual=lambda Y: Y[:, 0] - 200.0,
+        s_range=(-50, 50), h=0.1)
+
+    print("Single Shooting: Heated Rod")
+    print("---------------------------")
+    print(f"Initial slope T'(0): {s:.6f}")
+    print(f"T(10):               {T[-1, 0]:.6f} (target 200)")
+    print()
+
+    # --- Multiple shooting: pinned-fixed beam, compared with the closed form ---
+    def deflection(x):
+        return (-w / (48 * E * I)) * (2 * x**4 - 3 * L * x**3 + L**3 * x)
+
+    for n_workers in (1, 4):
+        start = time.perf_counter()
+        x, y, it = multiple_shooting(beam_ode, (0, L), beam_bc, np.zeros(4), h=1.0,
+                                     n_segments=4, n_workers=n_workers)
+        elapsed = time.perf_counter() - start
+        print(f"Multiple Shooting: Beam ({n_workers} worker(s), {elapsed:.2f} s)")
+
+    y = y[:, 0]   # deflection is the first state
+    i_max = np.argmin(y)
+    print("-------------------------------------")
+    print(f"Newton iterations:                   {it}")
+    print(f"Maximum deflection location (x_max): {x[i_max]:10.6f} cm")
+    print(f"Maximum deflection value (y_max):    {y[i_max]:10.6f} cm")
+    print(f"Max. error vs. closed form:          {np.max(np.abs(y - deflection(x))):.2e} cm")
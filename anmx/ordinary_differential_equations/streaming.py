@@ -0,0 +1,233 @@
+"""
+streaming.py
+--------------------------------
+Numerical Methods Implementation:
+Streaming ODE Output with Chunked Persistence.
+
+Algorithm Summary:
+euler_method and rk4_method keep the whole solution in memory, so memory
+grows linearly with the simulated time. ode_stream instead runs the same
+one-step methods as a generator and yields the solution in fixed-size
+chunks. Only one chunk is held at a time.
+
+Output can be thinned in two ways:
+  - decimation: keep every save_every-th step,
+  - dense output: report the solution at arbitrary times t_out using the
+    cubic Hermite interpolant of each step. The slope at the end of a
+    step is the first slope of the next step, so this costs no extra
+    derivative evaluations, and coarse output times do not force small
+    steps.
+
+NpyStreamWriter appends chunks to a .npy file on disk. The file can be
+read back in full or as a memory map with np.load(path, mmap_mode='r').
+
+"""
+
+import struct
+import numpy as np
+from anmx.ordinary_differential_equations.euler_method import euler_step
+from anmx.ordinary_differential_equations.runge_kutta_4 import rk4_step
+from anmx.ordinary_differential_equations.events import hermite_interpolant
+
+STEP_METHODS = {'euler': euler_step, 'rk4': rk4_step}
+
+
+def ode_stream(dydt, y0, t_span, h, method='rk4', chunk_size=1000,
+               save_every=1, t_out=None):
+    """
+    Integrates an ODE and yields the solution chunk by chunk.
+
+    Args:
+        dydt: The derivative function f(t, y). Returns dy/dt.
+        y0: Initial condition(s).
+        t_span: Tuple (t_start, t_end). The last step is shortened so the
+                integration ends exactly at t_end.
+        h: Step size.
+        method: 'rk4' or 'euler'.
+        chunk_size: Number of output points per yielded chunk.
+        save_every: Keep every save_every-th step (the last step is
+                    always kept). Ignored if t_out is given.
+        t_out: Optional increasing array of output times inside t_span.
+               The solution is interpolated at these times instead.
+
+    Yields:
+        (t_chunk, y_chunk) pairs with at most chunk_size rows each.
+    """
+    step = STEP_METHODS[method]
+    t_start, t_end = t_span
+    n_steps = int(np.ceil((t_end - t_start) / h - 1e-9))
+
+    y = np.array(y0, dtype=float)
+    f = np.asarray(dydt(t_start, y), dtype=float)
+
+    if t_out is not None:
+        t_out = np.asarray(t_out, dtype=float)
+        if t_out.size and (t_out[0] < t_start or t_out[-1] > t_end):
+            raise ValueError("t_out must lie inside t_span.")
+        if np.any(np.diff(t_out) < 0):
+            raise ValueError("t_out must be increasing.")
+
+    t_buffer = np.empty(chunk_size)
+    y_buffer = np.empty((chunk_size,) + y.shape)
+    n_buffered = 0
+    j = 0   # next entry of t_out
+
+    if t_out is None:
+        t_buffer[0] = t_start
+        y_buffer[0] = y
+        n_buffered = 1
+
+    for i in range(1, n_steps + 1):
+        t = t_start + (i - 1) * h
+        t_new = t_end if i == n_steps else t_start + i * h
+
+        y_new = step(dydt, t, y, t_new - t, f)
+        f_new = np.asarray(dydt(t_new, y_new), dtype=float)
+
+        if t_out is None:
+            if i % save_every == 0 or i == n_steps:
+                t_buffer[n_buffered] = t_new
+                y_buffer[n_buffered] = y_new
+                n_buffered += 1
+                if n_buffered == chunk_size:
+                    yield t_buffer.copy(), y_buffer.copy()
+                    n_buffered = 0
+        else:
+            if j < len(t_out) and t_out[j] <= t_new:
+                interp = hermite_interpolant(t, y, f, t_new, y_new, f_new)
+                while j < len(t_out) and t_out[j] <= t_new:
+                    t_buffer[n_buffered] = t_out[j]
+                    y_buffer[n_buffered] = interp(t_out[j])
+                    n_buffered += 1
+                    j += 1
+                    if n_buffered == chunk_size:
+                        yield t_buffer.copy(), y_buffer.copy()
+                        n_buffered = 0
+
+        y, f = y_new, f_new
+
+    if t_out is not None and j < len(t_out):
+        # Only possible when t_span has no steps (t_start == t_end)
+        t_buffer[n_buffered:n_buffered + len(t_out) - j] = t_out[j:]
+        y_buffer[n_buffered:n_buffered + len(t_out) - j] = y
+        n_buffered += len(t_out) - j
+
+    if n_buffered:
+        yield t_buffer[:n_buffered].copy(), y_buffer[:n_buffered].copy()
+
+
+class NpyStreamWriter:
+    """
+    Appends rows to a .npy file without holding the whole array in memory.
+
+    A fixed-size header is written up front and rewritten with the final
+    row count on close(). Use as a context manager:
+
+        with NpyStreamWriter('y.npy') as writer:
+            for t_chunk, y_chunk in ode_stream(...):
+                writer.append(y_chunk)
+    """
+
+    HEADER_SIZE = 128   # bytes, a multiple of 64 as the format recommends
+
+    def __init__(self, path):
+        self.path = path
+        self.n_rows = 0
+        self.row_shape = None
+        self.dtype = None
+        self._file = open(path, 'wb')
+
+    def _header(self):
+        """npy format 1.0 header for the rows written so far."""
+        header = repr({
+            'descr': np.lib.format.dtype_to_descr(self.dtype),
+            'fortran_order': False,
+            'shape': (self.n_rows,) + self.row_shape,
+        })
+        # magic string (6) + version (2) + header length (2) + header + '\n'
+        n_pad = self.HEADER_SIZE - 10 - len(header) - 1
+        if n_pad < 0:
+            raise ValueError("Row shape is too large for the reserved npy header.")
+        header = header + ' ' * n_pad + '\n'
+        return (np.lib.format.magic(1, 0) + struct.pack('<H', len(header))
+                + header.encode('latin1'))
+
+    def append(self, rows):
+        """Writes a chunk of rows (first axis) to the end of the file."""
+        rows = np.ascontiguousarray(rows)
+        if self.row_shape is None:
+            self.row_shape = rows.shape[1:]
+            self.dtype = rows.dtype
+            self._file.write(self._header())
+        elif rows.shape[1:] != self.row_shape:
+            raise ValueError(f"Row shape {rows.shape[1:]} does not match {self.row_shape}.")
+
+        self._file.write(rows.astype(self.dtype, copy=False).tobytes())
+        self.n_rows += rows.shape[0]
+
+    def close(self):
+        """Finalizes the header with the row count and closes the file."""
+        if self._file.closed:
+            return
+        if self.row_shape is None:
+            # Nothing was written: store an empty float array
+            self.row_shape = ()
+            self.dtype = np.dtype(float)
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def save_stream(stream, t_path, y_path):
+    """
+    Writes every chunk of an ode_stream to two .npy files.
+
+    Returns:
+        Number of rows written.
+    """
+    with NpyStreamWriter(t_path) as t_writer, NpyStreamWriter(y_path) as y_writer:
+        for t_chunk, y_chunk in stream:
+            t_writer.append(t_chunk)
+            y_writer.append(y_chunk)
+    return y_writer.n_rows
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import tracemalloc
+
+    # A lightly damped oscillator over a long time span
+    def oscillator(t, y):
+        return np.array([y[1], -0.001 * y[1] - 4.0 * y[0]])
+
+    t_span = (0, 3600.0)    # one hour of simulated seconds
+    h = 0.05                # 72,000 RK4 steps
+    t_out = np.linspace(*t_span, 361)  # save every 10 s
+
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        t_path = os.path.join(tmp, 't.npy')
+        y_path = os.path.join(tmp, 'y.npy')
+        n_rows = save_stream(ode_stream(oscillator, [1.0, 0.0], t_span, h,
+                                        chunk_size=512, t_out=t_out),
+                             t_path, y_path)
+        _, peak = tracemalloc.get_traced_memory()
+
+        y_saved = np.load(y_path, mmap_mode='r')
+        t_saved = np.load(t_path)
+        print("Streaming RK4 with Dense Output")
+        print("--------------------------------")
+        print(f"Steps taken:     {int(np.ceil((t_span[1] - t_span[0]) / h))}")
+        print(f"Rows saved:      {n_rows} (shape on disk {y_saved.shape})")
+        print(f"Last saved time: {t_saved[-1]:.1f} s")
+        print(f"Peak memory:     {peak / 1e6:.2f} MB "
+              f"(a full rk4_method run stores {16 * 7.2e4 / 1e6:.1f} MB)")
+        del y_saved
+    tracemalloc.stop()
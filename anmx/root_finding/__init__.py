@@ -0,0 +1 @@
+"""Root finding: bisection, Newton-Raphson and Newton's method for systems."""
@@ -12,13 +12,14 @@ changes. Convergence is guaranteed if f(x) is continuous and the root is bracket
 """
 
 import numpy as np
+from anmx.common.instrumentation import warn_not_converged
 
 def f(x):
     # Example function: f(x) = exp(-x) - x."""
     return np.exp(-x) - x
 
 
-def bisection(func, xl, xu, es=1e-7, maxit=50):
+def bisection(func, xl, xu, es=1e-7, maxit=50, callback=None):
     """
     Finds the root of func(x) = 0 using the Bisection Method.
 
@@ -32,6 +33,9 @@ def bisection(func, xl, xu, es=1e-7, maxit=50):
         Stopping criterion for relative error (default: 1e-7).
     maxit : int, optional
         Maximum number of iterations (default: 50).
+    callback : callable, optional
+        Called as callback(state) after every iteration; state has 'solver',
+        'iteration', 'x', 'error', 'xl' and 'xu' (see common/instrumentation.py).
 
     Returns
     -------
@@ -48,6 +52,9 @@ def bisection(func, xl, xu, es=1e-7, maxit=50):
     for i in range(maxit):
         xr = (xl + xu) / 2.0
         ea = abs((xr - xr_old) / xr)
+        if callback is not None:
+            callback({'solver': 'bisection', 'iteration': i + 1, 'x': xr, 'error': ea,
+                      'xl': xl, 'xu': xu})
         if ea < es:
             return xr, func(xr), ea, i + 1
         if func(xl) * func(xr) < 0:
@@ -55,6 +62,7 @@ def bisection(func, xl, xu, es=1e-7, maxit=50):
         else:
             xl = xr
         xr_old = xr
+    warn_not_converged('bisection', maxit, ea)
     return xr, func(xr), ea, i + 1
 
 
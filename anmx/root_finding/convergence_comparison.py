@@ -0,0 +1,73 @@
+import os
+import numpy as np
+from anmx.root_finding.bisection_method import bisection
+from anmx.root_finding.newton_raphson import newton_raphson
+from anmx.benchmarks.convergence_analysis import analyze
+
+def f(x):
+    """
+    The function whose root we want to find.
+    Example: f(x) = x^3 - x - 1
+    """
+    return x**3 - x - 1
+
+def df(x):
+    """
+    The derivative of f(x), required for Newton-Raphson.
+    f'(x) = 3x^2 - 1
+    """
+    return 3*x**2 - 1
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    # Plotting and reference-solution libraries are only needed here
+    import matplotlib.pyplot as plt
+    from scipy import optimize
+
+    # 1. Setup the Problem
+    # We use scipy to get the "ground truth" root for comparison
+    true_root = optimize.fsolve(f, 1.0)[0] 
+    print(f"True Root: {true_root:.8f}")
+
+    # 2. Run the Methods
+    # The solvers themselves run on a traced f that records every new
+    # estimate and its true error
+    # Bisection setup: Bracket [1, 2]
+    bisection_run = analyze(bisection, f, 1, 2, exact=true_root, es=1e-15)
+    bisection_errors = bisection_run['errors']
+
+    # Newton setup: Initial guess 1.0
+    newton_run = analyze(newton_raphson, f, df, 1.0, exact=true_root, es=1e-15)
+    newton_errors = newton_run['errors']
+
+    for name, run in (('Bisection', bisection_run), ('Newton-Raphson', newton_run)):
+        n_tol, _ = run['cost'][1e-8]
+        print(f"{name:<15} empirical order {run['order']:.2f}, "
+              f"{n_tol} evaluations to reach 1e-8")
+
+    # 3. Plot the Comparison
+    plt.figure(figsize=(10, 6))
+    
+    # Plot Bisection
+    plt.semilogy(range(len(bisection_errors)), bisection_errors, 
+                 label='Bisection Method', marker='o', linestyle='--', color='blue')
+    
+    # Plot Newton-Raphson
+    plt.semilogy(range(len(newton_errors)), newton_errors, 
+                 label='Newton-Raphson', marker='s', linestyle='-', color='red')
+
+    # Formatting
+    plt.title('Convergence Speed: Bisection vs. Newton-Raphson', fontsize=14)
+    plt.xlabel('Iteration Number', fontsize=12)
+    plt.ylabel('Absolute True Error (Log Scale)', fontsize=12)
+    plt.grid(True, which="both", ls="-", alpha=0.5)
+    plt.legend()
+    
+    # Add text annotation to explain the graph
+    plt.text(6, 1e-8, "Newton drops quadratically\n(very fast)", color='red')
+    plt.text(22, 1e-3, "Bisection drops linearly\n(slow & steady)", color='blue')
+
+    # Save or Show
+    plt.tight_layout()
+    plt.savefig(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'convergence_comparison.png')) # Saves the plot for your README
+    plt.show()
\ No newline at end of file
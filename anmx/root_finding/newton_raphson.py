@@ -13,6 +13,7 @@ if the initial guess is poor or f'(x) ≈ 0.
 """
 
 import numpy as np
+from anmx.common.instrumentation import warn_not_converged
 
 def f(x):
     """Example function: f(x) = exp(-x) - x."""
@@ -23,7 +24,7 @@ def df(x):
     return -np.exp(-x) - 1
 
 
-def newton_raphson(func, dfunc, x0, es=1e-7, maxit=50):
+def newton_raphson(func, dfunc, x0, es=1e-7, maxit=50, callback=None):
     """
     Finds the root of func(x) = 0 using the Newton-Raphson Method.
 
@@ -39,6 +40,9 @@ def newton_raphson(func, dfunc, x0, es=1e-7, maxit=50):
         Stopping criterion for relative error (default: 1e-7).
     maxit : int, optional
         Maximum number of iterations (default: 50).
+    callback : callable, optional
+        Called as callback(state) after every iteration; state has 'solver',
+        'iteration', 'x' and 'error' (see common/instrumentation.py).
 
     Returns
     -------
@@ -51,9 +55,12 @@ def newton_raphson(func, dfunc, x0, es=1e-7, maxit=50):
     for i in range(maxit):
         x1 = x0 - func(x0) / dfunc(x0)
         ea = abs((x1 - x0) / x1)
+        if callback is not None:
+            callback({'solver': 'newton_raphson', 'iteration': i + 1, 'x': x1, 'error': ea})
         if ea < es:
             return x1, func(x1), ea, i + 1
         x0 = x1
+    warn_not_converged('newton_raphson', maxit, ea)
     return x1, func(x1), ea, i + 1
 
 
@@ -0,0 +1,226 @@
+"""
+newton_systems.py
+--------------------------------
+Numerical Methods Implementation:
+Newton's Method for Systems of Nonlinear Equations.
+
+Algorithm Summary:
+Solves F(x) = 0 for a vector x by repeatedly solving the linearization
+    J(x_i) · dx = -F(x_i),    x_(i+1) = x_i + λ·dx
+where J is the Jacobian of F. Each linear solve uses LU decomposition
+with partial pivoting (linear_systems/lu_decomposition.py). Refactoring
+J costs O(n^3), so three modes are offered:
+    'newton'  : new Jacobian and LU every iteration (quadratic convergence)
+    'chord'   : Jacobian and LU frozen at the start, refreshed only if the
+                iteration stalls (linear convergence, O(n^2) per iteration)
+    'broyden' : one Jacobian, then rank-one (Broyden) updates of its
+                inverse after every step (superlinear, O(n^2) per iteration)
+A backtracking line search picks λ so that ||F|| decreases, which
+makes the method robust far from the root.
+
+"""
+
+import numpy as np
+from anmx.linear_systems.lu_decomposition import lu_decomposition, lu_solve
+from anmx.common.instrumentation import warn_not_converged
+
+
+def f(x):
+    """Example system (Chapra & Clough): u = x² + xy - 10, v = y + 3xy² - 57."""
+    return np.array([x[0]**2 + x[0]*x[1] - 10,
+                     x[1] + 3*x[0]*x[1]**2 - 57])
+
+
+def fd_jacobian(func, x, fx=None, vectorized=False):
+    """
+    Approximates the Jacobian of func at x by forward differences.
+
+    Parameters
+    ----------
+    func : callable
+        Vector function F(x).
+    x : ndarray
+        Point at which to evaluate the Jacobian.
+    fx : ndarray, optional
+        F(x), if already known.
+    vectorized : bool, optional
+        If True, func accepts an (n, m) array whose columns are points and
+        returns an (n, m) array, so all n perturbed points are evaluated
+        in a single call.
+
+    Returns
+    -------
+    (J, nfev) : tuple
+        J : Jacobian matrix (n x n)
+        nfev : number of function evaluations used
+    """
+    n = len(x)
+    nfev = 0
+    if fx is None:
+        fx = np.asarray(func(x), dtype=float)
+        nfev += 1
+
+    steps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+    if vectorized:
+        # Column j of X is x with component j perturbed
+        X = x[:, None] + np.diag(steps)
+        J = (np.asarray(func(X), dtype=float) - fx[:, None]) / steps
+        nfev += 1
+    else:
+        J = np.empty((n, n))
+        for j in range(n):
+            x_pert = x.copy()
+            x_pert[j] += steps[j]
+            J[:, j] = (np.asarray(func(x_pert), dtype=float) - fx) / steps[j]
+        nfev += n
+    return J, nfev
+
+
+def _line_search(func, x, dx, fx, max_halvings=10):
+    """
+    Backtracking on the residual norm: halves λ until
+        ||F(x + λ·dx)|| <= (1 - 1e-4·λ)·||F(x)||.
+
+    Returns (x_new, f_new, λ, nfev, accepted).
+    """
+    norm0 = np.linalg.norm(fx)
+    lam = 1.0
+    for k in range(max_halvings + 1):
+        x_new = x + lam * dx
+        f_new = np.asarray(func(x_new), dtype=float)
+        if np.linalg.norm(f_new) <= (1 - 1e-4 * lam) * norm0:
+            return x_new, f_new, lam, k + 1, True
+        lam *= 0.5
+    return x_new, f_new, lam, max_halvings + 1, False
+
+
+def newton_system(func, x0, jac=None, mode='newton', es=1e-10, maxit=100,
+                  line_search=True, vectorized=False):
+    """
+    Finds a root of the system func(x) = 0 using Newton's Method.
+
+    Parameters
+    ----------
+    func : callable
+        Vector function F(x) returning an array of the same length as x.
+    x0 : array_like
+        Initial guess.
+    jac : callable, optional
+        Jacobian function J(x). Finite differences are used if None.
+    mode : str, optional
+        'newton', 'chord' or 'broyden' (default: 'newton').
+    es : float, optional
+        Stopping criterion for the relative change ||dx|| / ||x|| (default: 1e-10).
+    maxit : int, optional
+        Maximum number of iterations (default: 100).
+    line_search : bool, optional
+        Use backtracking to guarantee a decrease of ||F|| (default: True).
+    vectorized : bool, optional
+        func can evaluate many points at once (see fd_jacobian).
+
+    Returns
+    -------
+    (x, f(x), ea, iter, stats) : tuple
+        x : estimated root
+        f(x) : function value at root
+        ea : approximate relative error
+        iter : iterations performed
+        stats : dict with 'nfev', 'njev' and 'nlu' counts
+    """
+    if mode not in ('newton', 'chord', 'broyden'):
+        raise ValueError("mode must be 'newton', 'chord' or 'broyden'.")
+
+    x = np.array(x0, dtype=float)
+    fx = np.asarray(func(x), dtype=float)
+    stats = {'nfev': 1, 'njev': 0, 'nlu': 0}
+
+    LU = None       # LU factors of the current Jacobian
+    H = None        # Broyden: approximate inverse Jacobian
+    fresh = False   # True if the factors were built at the current x
+
+    def refresh(x, fx):
+        if jac is None:
+            J, nfev = fd_jacobian(func, x, fx, vectorized)
+            stats['nfev'] += nfev
+        else:
+            J = np.asarray(jac(x), dtype=float)
+        stats['njev'] += 1
+        stats['nlu'] += 1
+        return lu_decomposition(J, pivot=True)
+
+    ea = np.inf
+    for i in range(maxit):
+        if LU is None or mode == 'newton':
+            LU = refresh(x, fx)
+            fresh = True
+            if mode == 'broyden':
+                # Inverse from the LU factors, one column at a time
+                H = np.column_stack([lu_solve(LU[0], LU[1], e, LU[2]) for e in np.eye(len(x))])
+
+        if mode == 'broyden':
+            dx = -H @ fx
+        else:
+            dx = lu_solve(LU[0], LU[1], -fx, LU[2])
+
+        if line_search:
+            x_new, f_new, lam, nfev, accepted = _line_search(func, x, dx, fx)
+            stats['nfev'] += nfev
+            if not accepted and not fresh:
+                # A stale Jacobian gave a poor direction: rebuild and retry
+                LU = None
+                continue
+        else:
+            x_new = x + dx
+            f_new = np.asarray(func(x_new), dtype=float)
+            stats['nfev'] += 1
+
+        s = x_new - x
+        if mode == 'broyden':
+            # "Good" Broyden update of the inverse (Sherman-Morrison form)
+            y = f_new - fx
+            Hy = H @ y
+            denom = s @ Hy
+            if abs(denom) > 1e-14 * np.linalg.norm(s) * np.linalg.norm(Hy):
+                H += np.outer(s - Hy, s @ H) / denom
+            else:
+                LU = None
+        elif mode == 'chord' and np.linalg.norm(f_new) > 0.5 * np.linalg.norm(fx):
+            # Slow linear convergence: refresh the frozen Jacobian next time
+            LU = None
+
+        x, fx = x_new, f_new
+        fresh = False
+
+        ea = np.linalg.norm(s, np.inf) / max(np.linalg.norm(x, np.inf), np.finfo(float).tiny)
+        if ea < es or not np.any(fx):
+            return x, fx, ea, i + 1, stats
+
+    warn_not_converged('newton_system', maxit, ea)
+    return x, fx, ea, maxit, stats
+
+
+if __name__ == "__main__":
+    root, froot, ea, it, stats = newton_system(f, [1.5, 3.5])
+    print("Newton's Method for Systems Example")
+    print("-----------------------------------")
+    print(f"Root estimate: {root}")
+    print(f"f(root): {froot}")
+    print(f"Relative error: {ea:.2e}")
+    print(f"Iterations: {it}")
+    print()
+
+    # Larger problem: Bratu equation -u'' = 2·exp(u) on (0, 1), u(0) = u(1) = 0,
+    # discretized with central differences on n interior points
+    n = 60
+    dxg = 1.0 / (n + 1)
+
+    def bratu(u):
+        u_pad = np.concatenate(([0.0], u, [0.0]))
+        return (-u_pad[:-2] + 2*u - u_pad[2:]) / dxg**2 - 2.0 * np.exp(u)
+
+    print(f"Bratu problem, n = {n}")
+    print(f"{'MODE':<10} | {'ITER':<5} | {'NFEV':<6} | {'NJEV':<5} | {'NLU':<4} | {'||F||'}")
+    for mode in ('newton', 'chord', 'broyden'):
+        u, fu, ea, it, stats = newton_system(bratu, np.zeros(n), mode=mode)
+        print(f"{mode:<10} | {it:<5} | {stats['nfev']:<6} | {stats['njev']:<5} | "
+              f"{stats['nlu']:<4} | {np.linalg.norm(fu):.1e}")